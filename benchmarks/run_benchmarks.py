@@ -0,0 +1,233 @@
+"""
+Benchmarks of the hot paths of the fristenkalender_generator (generation, conversion and export).
+Each benchmark runs over ranges of 1, 10 and 100 years and reports the run time and the peak memory (tracemalloc).
+
+Usage:
+    python benchmarks/run_benchmarks.py                                  # run all benchmarks and print the results
+    python benchmarks/run_benchmarks.py --output baseline.json           # additionally store the results
+    python benchmarks/run_benchmarks.py --compare baseline.json          # fail if a benchmark got slower than allowed
+    python benchmarks/run_benchmarks.py --filter create_ical --years 1 10
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType, FristWithAttributes
+from fristenkalender_generator.utils import convert_fristen_list_to_calendar_like_dictionary
+
+FIRST_YEAR = 2000
+ATTENDEE = "benchmark@hochfrequenz.de"
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    """
+    A benchmark over a range of years. setup is not measured; it returns the function that is measured.
+    """
+
+    name: str
+    setup: Callable[[range], Callable[[], object]]
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    The result of a benchmark over a number of years
+    """
+
+    name: str
+    number_of_years: int
+    min_seconds: float
+    median_seconds: float
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        """
+        identifies the result in a comparison
+        """
+        return f"{self.name}[{self.number_of_years}y]"
+
+
+def _generate_all_fristen(years: range) -> list[FristWithAttributes]:
+    generator = FristenkalenderGenerator()
+    return [frist for year in years for frist in generator.generate_all_fristen(year)]
+
+
+def _setup_generate_all_fristen(years: range) -> Callable[[], object]:
+    return lambda: _generate_all_fristen(years)
+
+
+def _setup_generate_fristen_for_type(fristen_type: FristenType) -> Callable[[range], Callable[[], object]]:
+    def _setup(years: range) -> Callable[[], object]:
+        def _run() -> None:
+            generator = FristenkalenderGenerator()
+            for year in years:
+                generator.generate_fristen_for_type(year, fristen_type)
+
+        return _run
+
+    return _setup
+
+
+def _setup_generate_all_fristen_for_given_lwt(years: range) -> Callable[[], object]:
+    def _run() -> None:
+        generator = FristenkalenderGenerator()
+        for year in years:
+            generator.generate_all_fristen_for_given_lwt(year, 0, "LWT")
+
+    return _run
+
+
+def _setup_convert_fristen_list_to_calendar_like_dictionary(years: range) -> Callable[[], object]:
+    fristen = _generate_all_fristen(years)
+    return lambda: convert_fristen_list_to_calendar_like_dictionary(fristen)
+
+
+def _setup_create_ical(years: range) -> Callable[[], object]:
+    fristen = _generate_all_fristen(years)
+    generator = FristenkalenderGenerator()
+    return lambda: generator.create_ical(ATTENDEE, list(fristen))
+
+
+def _setup_export_ical(years: range) -> Callable[[], object]:
+    generator = FristenkalenderGenerator()
+    calendar = generator.create_ical(ATTENDEE, list(_generate_all_fristen(years)))
+    file_path = Path(tempfile.mkdtemp()) / "benchmark.ics"
+    return lambda: generator.export_ical(file_path, calendar)
+
+
+BENCHMARKS: list[Benchmark] = [
+    Benchmark("generate_all_fristen", _setup_generate_all_fristen),
+    *(
+        Benchmark(f"generate_fristen_for_type[{fristen_type.value}]", _setup_generate_fristen_for_type(fristen_type))
+        for fristen_type in FristenType
+    ),
+    Benchmark("generate_all_fristen_for_given_lwt", _setup_generate_all_fristen_for_given_lwt),
+    Benchmark(
+        "convert_fristen_list_to_calendar_like_dictionary", _setup_convert_fristen_list_to_calendar_like_dictionary
+    ),
+    Benchmark("create_ical", _setup_create_ical),
+    Benchmark("export_ical", _setup_export_ical),
+]
+
+
+def run_benchmark(benchmark: Benchmark, number_of_years: int, repeat: int) -> BenchmarkResult:
+    """
+    Runs the benchmark repeat times (plus once more under tracemalloc to measure the peak memory)
+    """
+    function = benchmark.setup(range(FIRST_YEAR, FIRST_YEAR + number_of_years))
+    function()  # warm up (e.g. the holidays that are shared by all generators)
+    durations: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    # tracemalloc slows down the execution, hence the memory is measured in a separate run
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        name=benchmark.name,
+        number_of_years=number_of_years,
+        min_seconds=min(durations),
+        median_seconds=statistics.median(durations),
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+def run_benchmarks(name_filter: str, years: list[int], repeat: int) -> Iterator[BenchmarkResult]:
+    """
+    Runs all benchmarks whose name contains the name_filter for each number of years
+    """
+    for benchmark in BENCHMARKS:
+        if name_filter not in benchmark.name:
+            continue
+        for number_of_years in years:
+            yield run_benchmark(benchmark, number_of_years, repeat)
+
+
+def compare(results: list[BenchmarkResult], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """
+    Compares the median run times with the baseline; returns the keys of all benchmarks that got slower than the
+    tolerance (e.g. 0.2 for 20%) allows
+    """
+    regressions: list[str] = []
+    for result in results:
+        baseline_result = baseline.get(result.key)
+        if baseline_result is None:
+            print(f"{result.key:<70} no baseline")
+            continue
+        ratio = result.median_seconds / baseline_result["median_seconds"]
+        memory_ratio = result.peak_memory_bytes / max(baseline_result["peak_memory_bytes"], 1)
+        is_regression = ratio > 1 + tolerance
+        if is_regression:
+            regressions.append(result.key)
+        print(
+            f"{result.key:<70} time x{ratio:5.2f}  memory x{memory_ratio:5.2f}{'  REGRESSION' if is_regression else ''}"
+        )
+    return regressions
+
+
+def main() -> int:
+    """
+    entry point of the benchmarks; returns the exit code (1 if there are regressions)
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 10, 100], help="the numbers of years")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of measured runs per benchmark")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--output", type=Path, help="store the results as JSON (e.g. as baseline)")
+    parser.add_argument("--compare", type=Path, help="compare the results with a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown compared to the baseline")
+    arguments = parser.parse_args()
+
+    results: list[BenchmarkResult] = []
+    print(f"{'benchmark':<70} {'min [ms]':>10} {'median [ms]':>12} {'peak [KiB]':>11}")
+    for result in run_benchmarks(arguments.filter, arguments.years, arguments.repeat):
+        results.append(result)
+        print(
+            f"{result.key:<70} {result.min_seconds * 1000:>10.2f} {result.median_seconds * 1000:>12.2f}"
+            f" {result.peak_memory_bytes / 1024:>11.0f}"
+        )
+
+    if arguments.output is not None:
+        arguments.output.write_text(
+            json.dumps(
+                {
+                    "python": sys.version,
+                    "platform": platform.platform(),
+                    "results": {result.key: dataclasses.asdict(result) for result in results},
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    if arguments.compare is not None:
+        baseline = json.loads(arguments.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, arguments.tolerance)
+        if regressions:
+            print(
+                f"{len(regressions)} benchmark(s) got slower than {arguments.tolerance:.0%}: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,13 +7,23 @@ from .bdew_calendar_generator import (
     FristenType,
     FristWithAttributes,
     FristWithAttributesAndType,
+    FristWithAttributesAndTypes,
     Label,
     LwtLabel,
 )
+from .compact_fristen import CompactFrist, FristenColumns
+from .date_index import FristenDateIndex, FristenOfDate
+from .fristen_cache import FristenCache
 
 __all__ = [
+    "CompactFrist",
     "FristWithAttributes",
     "FristWithAttributesAndType",
+    "FristWithAttributesAndTypes",
+    "FristenCache",
+    "FristenColumns",
+    "FristenDateIndex",
+    "FristenOfDate",
     "FristenType",
     "FristenkalenderGenerator",
     "Label",
@@ -0,0 +1,101 @@
+"""
+This module contains asyncio counterparts of the generation and export methods of the FristenkalenderGenerator.
+The CPU heavy generation/serialization and the blocking file I/O run in worker threads, such that the event loop is
+never blocked for longer than it takes to hand over a chunk of a few events.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    ICAL_FOOTER,
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+
+EVENTS_PER_CHUNK = 64
+"""
+the default number of events that are serialized at once (in one worker thread call)
+"""
+
+
+def _serialize_next_ical_events(
+    generator: FristenkalenderGenerator,
+    fristen: Iterator[FristWithAttributes | FristWithAttributesAndType],
+    number_of_events: int,
+) -> bytes:
+    """
+    pulls (at most) the next number_of_events Fristen from the iterator and serializes them; b"" if it's exhausted
+    """
+    return b"".join(generator.serialize_ical_event(frist) for frist in islice(fristen, number_of_events))
+
+
+async def aiter_ical_chunks(
+    attendee: str,
+    fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+    generator: FristenkalenderGenerator | None = None,
+    events_per_chunk: int = EVENTS_PER_CHUNK,
+) -> AsyncIterator[bytes]:
+    """
+    Async variant of FristenkalenderGenerator.iter_ical_chunks: yields the calendar header, the events (in chunks of
+    events_per_chunk events each, serialized in a worker thread) and the calendar footer.
+    """
+    if events_per_chunk < 1:
+        raise ValueError(f"events_per_chunk has to be positive: {events_per_chunk}")
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    yield await asyncio.to_thread(generator.serialize_ical_header, attendee)
+    fristen_iterator = iter(fristen)
+    # the Fristen are pulled from the iterator in the worker thread, too (it may be a lazy generator)
+    while chunk := await asyncio.to_thread(_serialize_next_ical_events, generator, fristen_iterator, events_per_chunk):
+        yield chunk
+    yield ICAL_FOOTER
+
+
+async def async_export_ical_stream(
+    file_path: Path,
+    attendee: str,
+    fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+    generator: FristenkalenderGenerator | None = None,
+) -> None:
+    """
+    Async variant of FristenkalenderGenerator.export_ical_stream: writes the .ics file chunk by chunk.
+    """
+    file = await asyncio.to_thread(open, file_path, "wb")
+    try:
+        async for chunk in aiter_ical_chunks(attendee, fristen, generator):
+            await asyncio.to_thread(file.write, chunk)
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+async def async_generate_and_export_whole_calendar(
+    file_path: Path, attendee: str, year: int, generator: FristenkalenderGenerator | None = None
+) -> None:
+    """
+    Async variant of FristenkalenderGenerator.generate_and_export_whole_calendar
+    """
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    all_fristen = await asyncio.to_thread(generator.generate_all_fristen, year)
+    await async_export_ical_stream(file_path, attendee, all_fristen, generator)
+
+
+async def async_generate_and_export_fristen_for_type(
+    file_path: Path,
+    attendee: str,
+    year: int,
+    fristen_type: FristenType,
+    generator: FristenkalenderGenerator | None = None,
+) -> None:
+    """
+    Async variant of FristenkalenderGenerator.generate_and_export_fristen_for_type
+    """
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    fristen_for_type = await asyncio.to_thread(generator.generate_fristen_for_type, year, fristen_type)
+    await async_export_ical_stream(file_path, attendee, fristen_for_type, generator)
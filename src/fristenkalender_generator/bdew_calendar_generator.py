@@ -3,22 +3,32 @@ This module can produce a list of calendar entries with bdew Fristen
 """
 
 import dataclasses
-import re
+import heapq
 import sys
-from calendar import monthrange
 
 try:
     from datetime import UTC
 except ImportError:
     if sys.version_info >= (3, 11):
         raise
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from datetime import date, datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, cast
 
-from bdew_datetimes.periods import get_nth_working_day_of_month, get_previous_working_day
-from icalendar import Calendar, Event
+from fristenkalender_generator.holiday_provider import HolidayProvider, bdew_holiday_provider
+from fristenkalender_generator.ical_serializer import serialize_vevent
+from fristenkalender_generator.metrics import MetricsSink, measure_duration
+from fristenkalender_generator.working_days import WorkingDayIndex, _import_numpy
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from icalendar import Calendar, Event
+
+    from fristenkalender_generator.fristen_cache import FristenCache
 
 LwtLabel = Literal["LWT"] | Literal["3LWT"]
 Label = (
@@ -84,6 +94,16 @@ _month_mapping: dict[int, str] = {
 _24H_LFW_KEY_DATE = date(2025, 6, 6)
 
 
+def _iterate_months(first_month: tuple[int, int], last_month: tuple[int, int]) -> Iterator[tuple[int, int]]:
+    """
+    yields all (year, month) tuples from first_month to last_month (both inclusive)
+    """
+    year, month = first_month
+    while (year, month) <= last_month:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
 @dataclasses.dataclass(unsafe_hash=True)
 class FristWithAttributes:
     """
@@ -107,6 +127,172 @@ class FristWithAttributesAndType(FristWithAttributes):
     fristen_type: FristenType
 
 
+@dataclasses.dataclass(unsafe_hash=True)
+class FristWithAttributesAndTypes(FristWithAttributes):
+    """
+    This class represents a Frist of a combined calendar of multiple types, e.g. a 5WT which is both MABIS and KOV
+    """
+
+    fristen_types: tuple[FristenType, ...]  #: all (selected) types of the Frist, in the order of FristenType
+
+
+@dataclasses.dataclass(frozen=True)
+class FristKey:
+    """
+    The identity of a Frist, which doesn't change if the Frist moves (e.g. because of a new holiday):
+    its type, its label and the Fristenmonat (the month whose working days are counted)
+    """
+
+    fristen_type: FristenType | None  #: None for Fristen that are not specific to a type
+    label: Label
+    year: int  #: the year of the Fristenmonat
+    month: int  #: the Fristenmonat
+
+    def to_ical_uid(self) -> str:
+        """
+        Create a UID that is stable across regenerations, such that calendar clients can update events in place
+        """
+        fristen_type = self.fristen_type.value if self.fristen_type is not None else "ALL"
+        return _format_stable_ical_uid(fristen_type, self.label, self.year, self.month)
+
+
+def _format_stable_ical_uid(fristen_type: str, label: Label, year: int, month: int) -> str:
+    # UID: <type><label><year><month>
+    label_clean = label.replace("WT", "").replace("L", "L0")
+    return f"{fristen_type}{label_clean}{year}{month:02d}"
+
+
+def _get_ical_uid_type(frist: "FristWithAttributes | FristWithAttributesAndType") -> str:
+    """
+    Returns the type part of the UID of a Frist: the type, all types of a combined calendar (e.g. "MABISKOV") or "ALL"
+    """
+    if isinstance(frist, FristWithAttributesAndTypes):
+        return "".join(fristen_type.value for fristen_type in frist.fristen_types)
+    fristen_type = getattr(frist, "fristen_type", None)
+    return fristen_type.value if isinstance(fristen_type, FristenType) else "ALL"
+
+
+def _create_stable_ical_uid(frist: "FristWithAttributes | FristWithAttributesAndType") -> str:
+    """
+    Returns the UID of a Frist that is derived from its type(s) and its FristKey only (see FristKey.to_ical_uid)
+    """
+    return _format_stable_ical_uid(_get_ical_uid_type(frist), frist.label, *_get_fristenmonat(frist))
+
+
+def _get_ical_categories(frist: "FristWithAttributes | FristWithAttributesAndType") -> str | list[str]:
+    """
+    Returns the categories of the ical event of a Frist: its label and, in a combined calendar, all its types
+    """
+    if isinstance(frist, FristWithAttributesAndTypes):
+        return [frist.label, *(fristen_type.value for fristen_type in frist.fristen_types)]
+    return frist.label
+
+
+def _get_fristenmonat(frist: "FristWithAttributes | FristWithAttributesAndType") -> tuple[int, int]:
+    """
+    Returns the year and the month of the Fristenmonat of the given Frist
+    """
+    if frist.ref_not_in_the_same_month is None:
+        return frist.date.year, frist.date.month
+    # the ref. month is the month before the Fristenmonat (see FristenkalenderGenerator._generate_wt_frist)
+    month = frist.ref_not_in_the_same_month % 12 + 1
+    year = frist.date.year if month <= frist.date.month else frist.date.year - 1
+    return year, month
+
+
+def get_frist_key(frist: "FristWithAttributes | FristWithAttributesAndType") -> FristKey:
+    """
+    Returns the key of the given Frist (see FristKey).
+    Raises a TypeError for a Frist of a combined calendar (FristWithAttributesAndTypes), because a FristKey has only
+    one type.
+    """
+    if isinstance(frist, FristWithAttributesAndTypes):
+        raise TypeError(f"A FristKey can't represent the multiple types of a combined Frist: {frist}")
+    year, month = _get_fristenmonat(frist)
+    return FristKey(getattr(frist, "fristen_type", None), frist.label, year, month)
+
+
+def get_frist_sort_key(frist: "FristWithAttributes | FristWithAttributesAndType") -> tuple[date, int]:
+    """
+    Returns the key by which the Fristen of a calendar are sorted: by date, then by the order of the labels
+    """
+    return frist.date, _LABEL_POSITIONS[frist.label]
+
+
+def _get_fristenmonate(year: int, label: Label) -> Iterator[tuple[int, int]]:
+    """
+    yields the Fristenmonate of all Fristen with the given label that might be part of the calendar of the given year
+    """
+    # some WT fristen starting in Oct/Nov/Dec of the previous year might be relevant
+    first_month = (year - 1, 12) if label.endswith("LWT") else (year - 1, 10)
+    return _iterate_months(first_month, (year + 1, 1))
+
+
+def _get_calendar_bounds(year: int) -> tuple[date, date]:
+    """
+    the Hochfrequenz Fristenkalender ranges from December of the previous year until the end of January of the
+    following year; returns the first date and the first date after the calendar
+    """
+    return date(year - 1, 12, 1), date(year + 1, 2, 1)
+
+
+_MIN_WORKING_DAYS_PER_MONTH = 15
+"""
+a lower bound of the number of working days per month; used to estimate how many months a WT frist can span
+"""
+
+
+def _get_number_of_months_after_fristenmonat(nth_day: int, label: Label) -> int:
+    """
+    returns how many months after its Fristenmonat a Frist with the given label might be (at most)
+    """
+    if label.endswith("LWT"):
+        # LWT are counted within their month
+        return 0
+    return nth_day // _MIN_WORKING_DAYS_PER_MONTH
+
+
+def _add_fristen_types(
+    fristen: Iterable[FristWithAttributes], fristen_types: list[FristenType]
+) -> Iterator[FristWithAttributesAndType]:
+    """
+    yields each Frist once per fristen type
+    """
+    for frist in fristen:
+        for fristen_type in fristen_types:
+            yield FristWithAttributesAndType(
+                date=frist.date,
+                label=frist.label,
+                ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+                description=frist.description,
+                fristen_type=fristen_type,
+            )
+
+
+def _add_combined_fristen_types(
+    fristen: Iterable[FristWithAttributes], fristen_types: tuple[FristenType, ...]
+) -> Iterator[FristWithAttributesAndTypes]:
+    """
+    yields each Frist once, with all its fristen types
+    """
+    for frist in fristen:
+        yield FristWithAttributesAndTypes(
+            date=frist.date,
+            label=frist.label,
+            ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+            description=frist.description,
+            fristen_types=fristen_types,
+        )
+
+
+def _is_obsolete(frist: FristWithAttributes) -> bool:
+    """
+    3LWT originates from the "asynchrone Bilanzierung" which ends with the beginning of 24h Lieferantenwechsel
+    hence we don't need those kind of fristen afterward.
+    """
+    return frist.label == "3LWT" and frist.date >= _24H_LFW_KEY_DATE
+
+
 _fristen_type_to_label_mapping: dict[str, list[Label]] = {
     FristenType.MABIS.value: ["5WT", "12WT", "17WT", "18WT", "20WT", "30WT", "42WT", "LWT"],
     FristenType.GELI.value: ["16WT"],
@@ -146,6 +332,11 @@ A dictionary with a specific descriptions of the frists
 
 """
 
+ICAL_FOOTER = b"END:VCALENDAR\r\n"
+"""
+the last line of each serialized ical calendar
+"""
+
 GREETING: str = "Digitaler Hochfrequenz Fristenkalender \n"
 GENERAL_DESCRIPTION: str = (
     "\n Um die Kalenderereignisse einfach zu löschen, geben Sie \n"
@@ -157,6 +348,97 @@ GENERAL_DESCRIPTION: str = (
     "https://www.hochfrequenz.de/"
 )
 
+_DAYS_BY_LABEL: dict[Label, int] = {label: nth_day for nth_day, label in _DAYS_AND_LABELS.items()}
+
+_LABEL_POSITIONS: dict[Label, int] = {label: position for position, label in enumerate(_DAYS_AND_LABELS.values())}
+"""
+the position of each label in the calendar; Fristen on the same date are sorted by it
+"""
+
+_NEXT_FRIST_HORIZON = timedelta(days=366)
+"""
+next_frist searches for the next Frist within this time span
+"""
+
+_LABEL_ORDINALS: dict[Label, str] = {
+    label: "letzter" if days == 0 else (f"{days}. letzter" if label.endswith("LWT") else f"{days}.")
+    for days, label in _DAYS_AND_LABELS.items()
+}
+"""
+maps each label to the ordinal used in the description, e.g. '5WT' ⟶ '5.', 'LWT' ⟶ 'letzter', '3LWT' ⟶ '3. letzter'
+"""
+
+_DESCRIPTION_CACHE_SIZE = 4096
+"""
+the number of rendered descriptions that are cached (there are 14 labels x 12 months per year)
+"""
+
+
+@lru_cache(maxsize=_DESCRIPTION_CACHE_SIZE)
+def _render_frist_description(label: Label, year: int, month: int) -> str:
+    """
+    Renders the description of a Frist with the given label in the given month.
+    The results are cached and interned, such that all events with the same description share the same string.
+    """
+    wt = _LABEL_ORDINALS[label]
+    another_part: str = wt + " Werktag des Fristenmonats " + _month_mapping[month] + " " + str(year) + " \n"
+    frist_description: str = (
+        GREETING + "\n" + another_part + "\n" + specific_description[label] + "\n" + GENERAL_DESCRIPTION
+    )
+    return sys.intern(frist_description)
+
+
+@lru_cache(maxsize=_DESCRIPTION_CACHE_SIZE)
+def _render_series_description(label: Label, ref_not_in_the_same_month: int | None) -> str:
+    """
+    Renders the description of a series of Fristen with the given label (see _group_fristen_into_series).
+    Unlike _render_frist_description, it only names the Fristenmonat if it's the same for all Fristen of the series.
+    """
+    wt = _LABEL_ORDINALS[label]
+    if ref_not_in_the_same_month is None:
+        another_part = wt + " Werktag des jeweiligen Fristenmonats \n"
+    else:
+        # the ref. month is the month before the Fristenmonat (see _get_fristenmonat)
+        fristenmonat = ref_not_in_the_same_month % 12 + 1
+        another_part = wt + " Werktag des Fristenmonats " + _month_mapping[fristenmonat] + " \n"
+    return GREETING + "\n" + another_part + "\n" + specific_description[label] + "\n" + GENERAL_DESCRIPTION
+
+
+def _group_fristen_into_series(
+    fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+) -> list[list[FristWithAttributes | FristWithAttributesAndType]]:
+    """
+    Groups the Fristen by type, label and ref_not_in_the_same_month, i.e. into series whose events only differ in
+    their date. The Fristen of each series are sorted by date; Fristen that occur more than once (e.g. in the
+    concatenated calendars of consecutive years, which overlap) are only part of the series once.
+    The series are ordered by their first Frist.
+    """
+    series_by_key: dict[
+        tuple[FristenType | None, Label, int | None], dict[date, FristWithAttributes | FristWithAttributesAndType]
+    ] = {}
+    for frist in fristen:
+        key = (getattr(frist, "fristen_type", None), frist.label, frist.ref_not_in_the_same_month)
+        series_by_key.setdefault(key, {}).setdefault(frist.date, frist)
+    all_series = [sorted(series.values(), key=lambda frist: frist.date) for series in series_by_key.values()]
+    return sorted(all_series, key=lambda series: (series[0].date, _LABEL_POSITIONS[series[0].label]))
+
+
+def _utcnow() -> datetime:
+    """
+    returns the current time in UTC
+    """
+    if sys.version_info >= (3, 11):
+        return datetime.now(UTC)
+    return datetime.utcnow()
+
+
+Clock = Callable[[], datetime]
+"""
+a function that returns the current time (in UTC); used for the DTSTAMP and the UIDs of the ical events
+"""
+
+_NOT_MEASURED: AbstractContextManager[None] = nullcontext()
+
 
 class FristenkalenderGenerator:
     """
@@ -164,30 +446,132 @@ class FristenkalenderGenerator:
 
     """
 
-    def generate_frist_description(self, frist_date: date, label: Label) -> str:
+    def __init__(
+        self,
+        holiday_provider: HolidayProvider | None = None,
+        cache: "FristenCache | None" = None,
+        clock: Clock = _utcnow,
+        stable_uids: bool = False,
+        metrics: MetricsSink | None = None,
+    ) -> None:
         """
-        Generates a description of Frist for a given date with a given label
+        holiday_provider provides the BDEW holidays; defaults to the bdew_holiday_provider shared by the process.
+        If a cache is given, generate_all_fristen and generate_fristen_for_type (and hence the .ics exports) load
+        the Fristen from it if possible and store newly generated Fristen in it.
+        Note that the cache is only keyed by year, type and package versions, so it must not be shared between
+        generators with different holiday providers.
+        The clock provides the DTSTAMP (and the creation date in the UIDs) of the ical events.
+        If stable_uids is true, the UIDs are derived from the Fristen only (see FristKey.to_ical_uid).
+        Together with a fixed clock, e.g. clock=lambda: datetime(2025, 1, 1, tzinfo=UTC), the exports are
+        reproducible: the same calendar is always serialized to the same bytes.
+        If a metrics sink is given, the generator reports timings and counters of its phases to it (see metrics).
         """
-        if label == "LWT":
-            wt = "letzter"
-        elif label == "3LWT":
-            wt = "3. letzter"
-        else:
-            wt = str(re.findall(r"\d+", label)[0]).strip("'") + "."
-        year: str = str(frist_date.year)
-        month: str = _month_mapping[frist_date.month]  # Verwendung der Monatszahl statt des Namens
-        another_part: str = wt + " Werktag des Fristenmonats " + month + " " + year + " \n"
-        frist_description: str = (
-            GREETING + "\n" + another_part + "\n" + specific_description[label] + "\n" + GENERAL_DESCRIPTION
+        self._cache = cache
+        self._clock = clock
+        self._stable_uids = stable_uids
+        self._metrics = metrics
+        self._holiday_provider: HolidayProvider = (
+            holiday_provider if holiday_provider is not None else bdew_holiday_provider
         )
+        self._working_day_index: WorkingDayIndex | None = None
 
-        return frist_description
+    def _get_working_day_index(self, first_year: int, last_year: int) -> WorkingDayIndex:
+        """
+        Returns a working day index that covers (at least) the years first_year to last_year.
+        The index is reused as long as it covers the requested years and the holidays have not been invalidated;
+        otherwise a new one is built.
+        """
+        if (
+            self._working_day_index is None
+            or self._working_day_index.holiday_generation != self._holiday_provider.generation
+        ):
+            self._working_day_index = self._build_working_day_index(first_year, last_year)
+        elif not self._working_day_index.covers(first_year, last_year):
+            # the index grows (at least) by its own size, such that generating year after year doesn't rebuild it
+            # for each year (which would be quadratic in the number of years)
+            index_first_year = self._working_day_index.first_year
+            index_last_year = self._working_day_index.last_year
+            number_of_years = index_last_year - index_first_year + 1
+            if first_year < index_first_year:
+                index_first_year = min(first_year, index_first_year - number_of_years)
+            if last_year > index_last_year:
+                index_last_year = max(last_year, index_last_year + number_of_years)
+            self._working_day_index = self._build_working_day_index(index_first_year, index_last_year)
+        return self._working_day_index
+
+    def _build_working_day_index(self, first_year: int, last_year: int) -> WorkingDayIndex:
+        """
+        builds a new working day index for the years first_year to last_year (both inclusive)
+        """
+        if self._metrics is None:
+            return WorkingDayIndex(first_year, last_year, self._holiday_provider)
+        self._metrics.increment("working_day_index_years", last_year - first_year + 1)
+        with measure_duration(self._metrics, "build_working_day_index"):
+            return WorkingDayIndex(first_year, last_year, self._holiday_provider)
+
+    def _measure(self, name: str) -> AbstractContextManager[None]:
+        """
+        measures the duration of a with block if the generator has a metrics sink
+        """
+        if self._metrics is None:
+            return _NOT_MEASURED
+        return measure_duration(self._metrics, name)
+
+    def _count(self, name: str, value: int = 1) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(name, value)
+
+    def add_working_days(self, dates: "npt.ArrayLike", offsets: "npt.ArrayLike") -> "npt.NDArray[Any]":
+        """
+        Shifts each date by the respective number of working days (in one vectorized call; requires numpy), e.g.
+        offset -10 returns the 10th WT before the date (like "Lieferbeginn minus 10 WT") and offset 3 the 3rd WT after
+        the date. The date itself is never counted; an offset of 0 returns the date unchanged.
+        dates and offsets are broadcast against each other; returns a datetime64[D] array (NaT dates stay NaT).
+        """
+        np = _import_numpy()
+        days, day_offsets = np.broadcast_arrays(
+            np.asarray(dates, dtype="datetime64[D]"), np.asarray(offsets, dtype=np.int64)
+        )
+        is_date = ~np.isnat(days)
+        if not is_date.any():
+            no_days: npt.NDArray[Any] = days.copy()
+            return no_days
+        # there are more than 200 working days per year
+        years_of_offsets = int(np.abs(day_offsets[is_date]).max()) // 200 + 1
+        first_year = days[is_date].min().astype(date).year - years_of_offsets
+        last_year = days[is_date].max().astype(date).year + years_of_offsets
+        return self._get_working_day_index(first_year, last_year).add_working_days_to_dates(days, day_offsets)
+
+    def generate_frist_description(self, frist_date: date, label: Label) -> str:
+        """
+        Generates a description of Frist for a given date with a given label
+        """
+        return _render_frist_description(label, frist_date.year, frist_date.month)
 
     def generate_fristen_for_type(self, year: int, fristen_type: FristenType) -> list[FristWithAttributesAndType]:
         """
         Generates a list of fristen for a given year with a given type
         """
-        fristen: list[FristWithAttributesAndType] = []
+        if self._cache is not None:
+            cached_fristen = self._cache.load(year, fristen_type)
+            self._count("cache_misses" if cached_fristen is None else "cache_hits")
+            if cached_fristen is not None:
+                return cast(list[FristWithAttributesAndType], cached_fristen)
+        fristen = self.generate_fristen_for_type_for_range(year, year, fristen_type)[year]
+        if self._cache is not None:
+            self._cache.store(year, fristen_type, fristen)
+        return fristen
+
+    def generate_fristen_for_type_for_range(
+        self, start_year: int, end_year: int, fristen_type: FristenType
+    ) -> dict[int, list[FristWithAttributesAndType]]:
+        """
+        Generates the fristen with a given type for all years from start_year to end_year (both inclusive).
+        Returns a dictionary that maps each year to the list that generate_fristen_for_type would return for it.
+        """
+        fristen_by_year: dict[int, list[FristWithAttributesAndType]] = {
+            year: [] for year in range(start_year, end_year + 1)
+        }
 
         stringified_fristen_type: str = fristen_type.value
 
@@ -199,82 +583,147 @@ class FristenkalenderGenerator:
             elif "LWT" in label:
                 raise NotImplementedError("Only LWT and 3LWT are implemented at the moment")
             else:
-                nth_day = int(re.findall(r"\d+", label)[0])
+                nth_day = int(label.removesuffix("WT"))
             days_and_labels = [(nth_day, label)]
-            fristen_with_attributes = self.generate_specific_fristen(year, days_and_labels)
-            for frist in fristen_with_attributes:
-                frist_with_attributes_and_type = FristWithAttributesAndType(
-                    date=frist.date,
-                    label=frist.label,
-                    ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
-                    description=specific_description[label],
-                    fristen_type=fristen_type,
-                )
-                fristen.append(frist_with_attributes_and_type)
+            fristen_with_attributes_by_year = self.generate_specific_fristen_for_range(
+                start_year, end_year, days_and_labels
+            )
+            for year, fristen_with_attributes in fristen_with_attributes_by_year.items():
+                for frist in fristen_with_attributes:
+                    frist_with_attributes_and_type = FristWithAttributesAndType(
+                        date=frist.date,
+                        label=frist.label,
+                        ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+                        description=specific_description[label],
+                        fristen_type=fristen_type,
+                    )
+                    fristen_by_year[year].append(frist_with_attributes_and_type)
 
-        return fristen
+        return fristen_by_year
 
-    def generate_all_fristen_for_given_wt(self, year: int, nth_day: int, label: Label) -> list[FristWithAttributes]:
+    def generate_fristen_for_types(
+        self, year: int, fristen_types: Iterable[FristenType]
+    ) -> list[FristWithAttributesAndType]:
         """
-        Generate the list of fristen for a given year that are on the nth WT (Werktag) of each month of the calendar
+        Generates the fristen of all given types for a given year, sorted by date (then label and type).
+        Labels that are used by multiple types (e.g. 5WT by MABIS and KOV) are calculated only once.
         """
+        return self.generate_fristen_for_types_for_range(year, year, fristen_types)[year]
 
-        fristen: list[FristWithAttributes] = []
+    def generate_fristen_for_types_for_range(
+        self, start_year: int, end_year: int, fristen_types: Iterable[FristenType]
+    ) -> dict[int, list[FristWithAttributesAndType]]:
+        """
+        Generates the fristen of all given types for all years from start_year to end_year (both inclusive).
+        Returns a dictionary that maps each year to the list that generate_fristen_for_types would return for it.
+        """
+        fristen_types_by_label, fristen_by_label = self._generate_fristen_by_label_for_types(
+            start_year, end_year, fristen_types
+        )
+        fristen_by_year: dict[int, list[FristWithAttributesAndType]] = {}
+        for year in range(start_year, end_year + 1):
+            fristen_streams = [
+                _add_fristen_types(fristen_by_year_for_label[year], fristen_types_by_label[label])
+                for label, fristen_by_year_for_label in fristen_by_label.items()
+            ]
+            # merging the sorted streams is stable, i.e. Fristen on the same date keep the order of the labels
+            fristen_by_year[year] = list(heapq.merge(*fristen_streams, key=lambda frist: frist.date))
+        return fristen_by_year
 
-        # some fristen starting in Oct/Nov/Dec of the previous year might be relevant
-        # we first add them all to the result list and later on remove those entries
-        # that are not relevant
+    def generate_combined_fristen_for_types(
+        self, year: int, fristen_types: Iterable[FristenType]
+    ) -> list[FristWithAttributesAndTypes]:
+        """
+        Generates a combined calendar of all given types for a given year, sorted by date (then label).
+        Unlike generate_fristen_for_types, a Frist that belongs to multiple types (e.g. 5WT to MABIS and KOV) is
+        returned only once, with all its types.
+        """
+        return self.generate_combined_fristen_for_types_for_range(year, year, fristen_types)[year]
 
-        # oct, nov and dec from last year
+    def generate_combined_fristen_for_types_for_range(
+        self, start_year: int, end_year: int, fristen_types: Iterable[FristenType]
+    ) -> dict[int, list[FristWithAttributesAndTypes]]:
+        """
+        Generates the combined calendars of all given types for all years from start_year to end_year (both
+        inclusive). Returns a dictionary that maps each year to the list that generate_combined_fristen_for_types
+        would return for it.
+        """
+        fristen_types_by_label, fristen_by_label = self._generate_fristen_by_label_for_types(
+            start_year, end_year, fristen_types
+        )
+        fristen_by_year: dict[int, list[FristWithAttributesAndTypes]] = {}
+        for year in range(start_year, end_year + 1):
+            fristen_streams = [
+                _add_combined_fristen_types(fristen_by_year_for_label[year], tuple(fristen_types_by_label[label]))
+                for label, fristen_by_year_for_label in fristen_by_label.items()
+            ]
+            fristen_by_year[year] = list(heapq.merge(*fristen_streams, key=lambda frist: frist.date))
+        return fristen_by_year
 
-        for month in range(10, 13):
-            nth_working_day_of_month_date = get_nth_working_day_of_month(nth_day, start=date(year - 1, month, 1))
-            if nth_working_day_of_month_date.month != month:
-                ref_not_in_the_same_month = month - 1
-            else:
-                ref_not_in_the_same_month = None
+    def _generate_fristen_by_label_for_types(
+        self, start_year: int, end_year: int, fristen_types: Iterable[FristenType]
+    ) -> tuple[dict[Label, list[FristenType]], dict[Label, dict[int, list[FristWithAttributes]]]]:
+        """
+        Returns the types of each label of the given fristen types (in the order of FristenType) and the Fristen of
+        each of these labels by year (in the order of the calendar). Each label is calculated only once.
+        """
+        selected_fristen_types = set(fristen_types)
+        fristen_types_by_label: dict[Label, list[FristenType]] = {}
+        for fristen_type in FristenType:  # in the order of the enum, such that the result doesn't depend on the input
+            if fristen_type in selected_fristen_types:
+                for label in _fristen_type_to_label_mapping[fristen_type.value]:
+                    fristen_types_by_label.setdefault(label, []).append(fristen_type)
+        # the Fristen of each label are already sorted by date
+        fristen_by_label = {
+            label: self.generate_specific_fristen_for_range(start_year, end_year, [(_DAYS_BY_LABEL[label], label)])
+            for label in sorted(fristen_types_by_label, key=_LABEL_POSITIONS.__getitem__)
+        }
+        return fristen_types_by_label, fristen_by_label
 
-            fristen.append(
-                FristWithAttributes(
-                    nth_working_day_of_month_date, label, ref_not_in_the_same_month, specific_description[label]
-                )
-            )
+    def _generate_wt_frist(self, year: int, month: int, nth_day: int, label: Label) -> FristWithAttributes:
+        """
+        Generate a frist on the nth WT (Werktag) of the given month.
+        """
+        working_day_index = self._get_working_day_index(year, year + 1)
+        nth_working_day_of_month_date = working_day_index.get_nth_working_day_of_month(nth_day, year, month)
+        ref_not_in_the_same_month: int | None = None
+        if nth_working_day_of_month_date.month != month:
+            ref_not_in_the_same_month = month - 1 if month > 1 else 12
+        return FristWithAttributes(
+            nth_working_day_of_month_date, label, ref_not_in_the_same_month, specific_description[label]
+        )
 
-        # this year
-        n_months = 12
-        for i_month in range(1, n_months + 1):
-            nth_working_day_of_month_date = get_nth_working_day_of_month(nth_day, start=date(year, i_month, 1))
-            if nth_working_day_of_month_date.month != i_month:
-                ref_not_in_the_same_month = i_month - 1
-                if ref_not_in_the_same_month < 1:
-                    ref_not_in_the_same_month += 12
-            else:
-                ref_not_in_the_same_month = None
-            fristen.append(
-                FristWithAttributes(
-                    nth_working_day_of_month_date, label, ref_not_in_the_same_month, specific_description[label]
-                )
-            )
+    def generate_all_fristen_for_given_wt(self, year: int, nth_day: int, label: Label) -> list[FristWithAttributes]:
+        """
+        Generate the list of fristen for a given year that are on the nth WT (Werktag) of each month of the calendar
+        """
+        return self._generate_all_fristen_for_given_wt_for_range(year, year, nth_day, label)[year]
 
-        # jan of next year
-        nth_working_day_of_month_date = get_nth_working_day_of_month(nth_day, start=date(year + 1, 1, 1))
-        if nth_working_day_of_month_date.month != 1:
-            ref_not_in_the_same_month = 11
-        else:
-            ref_not_in_the_same_month = None
-        fristen.append(
-            FristWithAttributes(
-                nth_working_day_of_month_date, label, ref_not_in_the_same_month, specific_description[label]
-            )
-        )
+    def _generate_all_fristen_for_given_wt_for_range(
+        self, start_year: int, end_year: int, nth_day: int, label: Label
+    ) -> dict[int, list[FristWithAttributes]]:
+        """
+        Generate the fristen on the nth WT (Werktag) for each year from start_year to end_year (both inclusive).
+        The frist of each month is calculated only once, even if it is relevant for two neighbouring years.
+        """
+        self._get_working_day_index(start_year - 1, end_year + 2)  # build the index once for all months below
 
-        # the Hochfrequenz Fristenkalender ranges from December of the previous year
-        # until the end of January of the following year
-        lower_bound = date(year - 1, 12, 1)
-        upper_bound = date(year + 1, 2, 1)
-        fristen_filtered = [frist for frist in fristen if lower_bound <= frist.date < upper_bound]
+        # some fristen starting in Oct/Nov/Dec of the previous year might be relevant
+        # we first calculate them all and later on remove those entries
+        # that are not relevant for the respective year
+        fristen_by_month: dict[tuple[int, int], FristWithAttributes] = {
+            year_and_month: self._generate_wt_frist(*year_and_month, nth_day, label)
+            for year_and_month in _iterate_months((start_year - 1, 10), (end_year + 1, 1))
+        }
+
+        fristen_by_year: dict[int, list[FristWithAttributes]] = {}
+        for year in range(start_year, end_year + 1):
+            # oct, nov and dec from last year, this year and jan of next year
+            fristen = [fristen_by_month[year_and_month] for year_and_month in _get_fristenmonate(year, label)]
+            lower_bound, upper_bound = _get_calendar_bounds(year)
+            fristen_by_year[year] = [frist for frist in fristen if lower_bound <= frist.date < upper_bound]
 
-        return fristen_filtered
+        return fristen_by_year
 
     def _generate_lwt_frist(self, year: int, month: int, nth_day: int, label: LwtLabel) -> FristWithAttributes:
         """
@@ -295,16 +744,8 @@ class FristenkalenderGenerator:
         # - Monatsletzter ist der 31.10. -> 28.10. = 1 LWT
         # - 27.10. = 2 LWT
         # - 26.10. = 3 LWT
-        last_day_of_month = monthrange(year, month)[1]
-        last_date_of_month = date(year, month, last_day_of_month)
-        _0lwt = last_date_of_month
-        if nth_day == 0:
-            first_date_of_next_month = last_date_of_month + timedelta(days=1)
-            result = get_previous_working_day(first_date_of_next_month)
-        else:
-            result = _0lwt
-            for _ in range(nth_day):  # each iteration 0LWT => 1LWT => 2LWT => 3LWT ...
-                result = get_previous_working_day(result)
+        working_day_index = self._get_working_day_index(year, year)
+        result = working_day_index.get_nth_last_working_day_of_month(nth_day, year, month)
         return FristWithAttributes(result, label, None, specific_description[label])
 
     def generate_all_fristen_for_given_lwt(self, year: int, nth_day: int, label: LwtLabel) -> list[FristWithAttributes]:
@@ -314,35 +755,238 @@ class FristenkalenderGenerator:
         LWT are counted back into the month starting from the last day of the month.
         The last day of the month is counted irrespective if it is a Werktag or not.
         """
+        return self._generate_all_fristen_for_given_lwt_for_range(year, year, nth_day, label)[year]
 
-        fristen: list[FristWithAttributes] = []
+    def _generate_all_fristen_for_given_lwt_for_range(
+        self, start_year: int, end_year: int, nth_day: int, label: LwtLabel
+    ) -> dict[int, list[FristWithAttributes]]:
+        """
+        Generate the fristen on the nth LWT (letzter Werktag) for each year from start_year to end_year (both
+        inclusive). The frist of each month is calculated only once, even if it is relevant for two neighbouring years.
+        """
+        self._get_working_day_index(start_year - 1, end_year + 1)  # build the index once for all months below
 
-        # dez last year
-        fristen.append(self._generate_lwt_frist(year - 1, 12, nth_day, label))
+        fristen_by_month: dict[tuple[int, int], FristWithAttributes] = {
+            year_and_month: self._generate_lwt_frist(*year_and_month, nth_day, label)
+            for year_and_month in _iterate_months((start_year - 1, 12), (end_year + 1, 1))
+        }
 
-        # this year
-        n_months = 12
-        for i_month in range(1, n_months + 1):
-            fristen.append(self._generate_lwt_frist(year, i_month, nth_day, label))
+        fristen_by_year: dict[int, list[FristWithAttributes]] = {}
+        for year in range(start_year, end_year + 1):
+            # dez last year, this year and jan next year
+            fristen = [fristen_by_month[year_and_month] for year_and_month in _get_fristenmonate(year, label)]
+            fristen_by_year[year] = [frist for frist in fristen if not _is_obsolete(frist)]
+
+        return fristen_by_year
+
+    def _generate_frist_for_calendar(
+        self, year: int, fristenmonat: tuple[int, int], nth_day: int, label: Label
+    ) -> FristWithAttributes | None:
+        """
+        Generate the frist with the given label whose working days are counted in the given month (year, month).
+        Returns None if the frist is not part of the calendar of the given year.
+        """
+        if label == "LWT" or label == "3LWT":  # noqa: PLR1714
+            lwt_frist = self._generate_lwt_frist(*fristenmonat, nth_day, label)
+            return None if _is_obsolete(lwt_frist) else lwt_frist
+        wt_frist = self._generate_wt_frist(*fristenmonat, nth_day, label)
+        lower_bound, upper_bound = _get_calendar_bounds(year)
+        return wt_frist if lower_bound <= wt_frist.date < upper_bound else None
 
-        # jan next year
-        fristen.append(self._generate_lwt_frist(year + 1, 1, nth_day, label))
-        # 3LWT originates from the "asynchrone Bilanzierung" which ends with the beginning of 24h Lieferantenwechsel
-        # hence we don't need those kind of fristen afterward.
-        fristen_without_3lwt_after_24h_lfw = [
-            f for f in fristen if not (f.label == "3LWT" and f.date >= _24H_LFW_KEY_DATE)
+    @staticmethod
+    def get_labels(fristen_type: FristenType | None = None) -> list[Label]:
+        """
+        Returns the labels of the given fristen type (or of the whole calendar if fristen_type is None) in the order
+        of the calendar
+        """
+        if fristen_type is None:
+            return list(_DAYS_AND_LABELS.values())
+        return list(_fristen_type_to_label_mapping[fristen_type.value])
+
+    def get_fristenmonate(self, year: int, label: Label) -> list[tuple[int, int]]:
+        """
+        Returns the Fristenmonate (year, month) of all Fristen with the given label that might be part of the calendar
+        of the given year
+        """
+        return list(_get_fristenmonate(year, label))
+
+    def get_fristenmonate_depending_on(self, day: date, label: Label) -> set[tuple[int, int]]:
+        """
+        Returns the Fristenmonate (year, month) of the Fristen with the given label whose date might change if the
+        given day becomes (or is no longer) a working day
+        """
+        # the nth WT might be in one of the months after its Fristenmonat
+        months_before = _get_number_of_months_after_fristenmonat(_DAYS_BY_LABEL[label], label)
+        month_index = day.year * 12 + day.month - 1
+        return {(index // 12, index % 12 + 1) for index in range(month_index - months_before, month_index + 1)}
+
+    def generate_frist_for_fristenmonat(
+        self, year: int, fristenmonat: tuple[int, int], label: Label, fristen_type: FristenType | None = None
+    ) -> FristWithAttributes | FristWithAttributesAndType | None:
+        """
+        Generates the Frist with the given label whose working days are counted in the given Fristenmonat
+        (year, month), with the given type (if any). Returns None if the Frist is not part of the calendar of the
+        given year (see get_fristenmonate).
+        """
+        frist = self._generate_frist_for_calendar(year, fristenmonat, _DAYS_BY_LABEL[label], label)
+        if frist is None or fristen_type is None:
+            return frist
+        return FristWithAttributesAndType(
+            date=frist.date,
+            label=frist.label,
+            ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+            description=frist.description,
+            fristen_type=fristen_type,
+        )
+
+    def fristen_between(
+        self,
+        start: date,
+        end: date,
+        fristen_types: Iterable[FristenType] | None = None,
+        labels: Iterable[Label] | None = None,
+    ) -> Iterator[FristWithAttributes | FristWithAttributesAndType]:
+        """
+        Lazily yields the Fristen from start to end (both inclusive) in date order.
+        Only the months that might contain Fristen in this window are calculated (one after another), so the first
+        Fristen are yielded before the later months are calculated.
+        If fristen_types are given, the Fristen of these types (FristWithAttributesAndType) are yielded, otherwise
+        all Fristen of the calendar (without type). The labels (if given) restrict the result to these labels.
+        Other than the calendars of overlapping years (see generate_all_fristen), each Frist is yielded only once.
+        """
+        if start > end:
+            raise ValueError(f"start ({start}) must not be after end ({end})")
+        days_and_labels_and_types: list[tuple[int, Label, FristenType | None]]
+        if fristen_types is None:
+            days_and_labels_and_types = [(nth_day, label, None) for nth_day, label in _DAYS_AND_LABELS.items()]
+        else:
+            days_and_labels_and_types = [
+                (_DAYS_BY_LABEL[label], label, fristen_type)
+                for fristen_type in fristen_types
+                for label in _fristen_type_to_label_mapping[fristen_type.value]
+            ]
+        if labels is not None:
+            selected_labels = set(labels)
+            days_and_labels_and_types = [entry for entry in days_and_labels_and_types if entry[1] in selected_labels]
+        if not days_and_labels_and_types:
+            return
+        fristen_type_positions = {fristen_type: position for position, fristen_type in enumerate(FristenType)}
+        months_after_fristenmonat = [
+            _get_number_of_months_after_fristenmonat(nth_day, label) for nth_day, label, _ in days_and_labels_and_types
         ]
-        return fristen_without_3lwt_after_24h_lfw
+        start_month_index = start.year * 12 + start.month - 1
+        first_month_index = start_month_index - max(months_after_fristenmonat)
+        self._get_working_day_index(first_month_index // 12, end.year + 1)  # build the index once for all months
+
+        # the Fristen of a Fristenmonat are never before its first day; hence, all Fristen before the first day of
+        # the next Fristenmonat are final and can be yielded
+        pending_fristen: list[tuple[date, int, int, FristWithAttributes | FristWithAttributesAndType]] = []
+        first_month = (first_month_index // 12, first_month_index % 12 + 1)
+        for year, month in _iterate_months(first_month, (end.year, end.month)):
+            first_day_of_month = date(year, month, 1)
+            while pending_fristen and pending_fristen[0][0] < first_day_of_month:
+                yield heapq.heappop(pending_fristen)[-1]
+            for (nth_day, label, fristen_type), number_of_months in zip(
+                days_and_labels_and_types, months_after_fristenmonat, strict=True
+            ):
+                if year * 12 + month - 1 < start_month_index - number_of_months:
+                    continue  # the Fristen of this label in this month are before start
+                if label == "LWT" or label == "3LWT":  # noqa: PLR1714
+                    frist = self._generate_lwt_frist(year, month, nth_day, label)
+                    if _is_obsolete(frist):
+                        continue
+                else:
+                    frist = self._generate_wt_frist(year, month, nth_day, label)
+                if not start <= frist.date <= end:
+                    continue
+                if fristen_type is None:
+                    heapq.heappush(pending_fristen, (frist.date, _LABEL_POSITIONS[label], -1, frist))
+                    continue
+                frist_with_type = FristWithAttributesAndType(
+                    date=frist.date,
+                    label=frist.label,
+                    ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+                    description=frist.description,
+                    fristen_type=fristen_type,
+                )
+                heapq.heappush(
+                    pending_fristen,
+                    (frist.date, _LABEL_POSITIONS[label], fristen_type_positions[fristen_type], frist_with_type),
+                )
+        while pending_fristen:
+            yield heapq.heappop(pending_fristen)[-1]
+
+    def next_frist(
+        self, after: date, label: Label | None = None, fristen_type: FristenType | None = None
+    ) -> FristWithAttributes | FristWithAttributesAndType | None:
+        """
+        Returns the first Frist after the given date, optionally with the given label and/or of the given type.
+        Returns None if there is no such Frist within the following year (e.g. 3LWT after the 24h Lieferantenwechsel).
+        """
+        fristen = self.fristen_between(
+            after + timedelta(days=1),
+            after + _NEXT_FRIST_HORIZON,
+            fristen_types=None if fristen_type is None else [fristen_type],
+            labels=None if label is None else [label],
+        )
+        return next(fristen, None)
 
     def generate_all_fristen(self, year: int) -> list[FristWithAttributes]:
         """
         Generate the list of all Fristen in the calendar for a given year
         """
+        if self._cache is not None:
+            cached_fristen = self._cache.load(year, None)
+            self._count("cache_misses" if cached_fristen is None else "cache_hits")
+            if cached_fristen is not None:
+                return cached_fristen
         days_and_labels = list(_DAYS_AND_LABELS.items())
-        fristen = self.generate_specific_fristen(year, days_and_labels)
-        fristen.sort(key=lambda fwa: fwa.date)
+        fristen = self.generate_specific_fristen(year, days_and_labels)  # already sorted by date
+        if self._cache is not None:
+            self._cache.store(year, None, fristen)
         return fristen
 
+    def _iter_fristen_for_label(self, year: int, nth_day: int, label: Label) -> Iterator[FristWithAttributes]:
+        """
+        Lazily yields the Fristen with the given label in the calendar of the given year in date order
+        """
+        for fristenmonat in _get_fristenmonate(year, label):
+            frist = self._generate_frist_for_calendar(year, fristenmonat, nth_day, label)
+            if frist is not None:
+                yield frist
+
+    def iter_fristen(self, years: int | range, labels: Iterable[Label] | None = None) -> Iterator[FristWithAttributes]:
+        """
+        Lazily yields the Fristen of the calendar of the given year (or the calendars of a range of years, one after
+        another), optionally only those with the given labels.
+        The Fristen are yielded in the same order as generate_all_fristen returns them, but one by one: the Fristen
+        of each label are calculated month by month and the labels are merged on the fly.
+        """
+        if labels is None:
+            days_and_labels = list(_DAYS_AND_LABELS.items())
+        else:
+            selected_labels = set(labels)
+            if not selected_labels <= _DAYS_BY_LABEL.keys():
+                raise ValueError(f"Unknown labels: {selected_labels - _DAYS_BY_LABEL.keys()}")
+            days_and_labels = [
+                (nth_day, label) for nth_day, label in _DAYS_AND_LABELS.items() if label in selected_labels
+            ]
+        for year in [years] if isinstance(years, int) else years:
+            self._get_working_day_index(year - 1, year + 2)  # build the index once for all months of the calendar
+            yield from heapq.merge(
+                *(self._iter_fristen_for_label(year, nth_day, label) for nth_day, label in days_and_labels),
+                key=lambda frist: frist.date,
+            )
+
+    def generate_all_fristen_for_range(self, start_year: int, end_year: int) -> dict[int, list[FristWithAttributes]]:
+        """
+        Generate the lists of all Fristen in the calendars for all years from start_year to end_year (both inclusive).
+        Returns a dictionary that maps each year to the list that generate_all_fristen would return for it.
+        Compared to calling generate_all_fristen in a loop, each month is only calculated once.
+        """
+        days_and_labels = list(_DAYS_AND_LABELS.items())
+        return self.generate_specific_fristen_for_range(start_year, end_year, days_and_labels)
+
     def generate_specific_fristen(
         self, year: int, days_and_labels: list[tuple[int, Label]]
     ) -> list[FristWithAttributes]:
@@ -352,73 +996,274 @@ class FristenkalenderGenerator:
         The only two valid format for the label string is an integer followed by one of the two endings:
         WT (Werktag) or LWT (letzter Werktag)
         """
+        return self.generate_specific_fristen_for_range(year, year, days_and_labels)[year]
+
+    def generate_specific_fristen_for_range(
+        self, start_year: int, end_year: int, days_and_labels: list[tuple[int, Label]]
+    ) -> dict[int, list[FristWithAttributes]]:
+        """
+        Generate the lists of Fristen for a given set of Fristen (see generate_specific_fristen) for all years from
+        start_year to end_year (both inclusive). Returns a dictionary that maps each year to its (sorted) Fristen.
+        """
+        if start_year > end_year:
+            raise ValueError(f"start_year ({start_year}) must not be after end_year ({end_year})")
+        with self._measure("generate_fristen"):
+            fristen_by_year = self._generate_specific_fristen_for_range(start_year, end_year, days_and_labels)
+        if self._metrics is not None:
+            self._metrics.increment("fristen_generated", sum(len(fristen) for fristen in fristen_by_year.values()))
+        return fristen_by_year
 
-        fristen = []
+    def _generate_specific_fristen_for_range(
+        self, start_year: int, end_year: int, days_and_labels: list[tuple[int, Label]]
+    ) -> dict[int, list[FristWithAttributes]]:
+        fristen_by_year_and_label: dict[int, list[list[FristWithAttributes]]] = {
+            year: [] for year in range(start_year, end_year + 1)
+        }
         for days, label in days_and_labels:
             if label == "LWT" or label == "3LWT":  # noqa: PLR1714
                 # we need the x==FOO or x==BAR form (not `in`) for mypy LwtLabel type narrowing
-                fristen += self.generate_all_fristen_for_given_lwt(year, days, label)
+                fristen_for_label_by_year = self._generate_all_fristen_for_given_lwt_for_range(
+                    start_year, end_year, days, label
+                )
             elif label.endswith("WT"):
-                fristen += self.generate_all_fristen_for_given_wt(year, days, label)
+                fristen_for_label_by_year = self._generate_all_fristen_for_given_wt_for_range(
+                    start_year, end_year, days, label
+                )
             else:
                 raise ValueError(f"The label '{label}' must end with either 'WT' or 'LWT'")
+            for year, fristen_for_label in fristen_for_label_by_year.items():
+                fristen_by_year_and_label[year].append(fristen_for_label)
 
-        fristen.sort(key=lambda fwa: fwa.date)
-        return fristen
+        # the Fristen of each label are sorted by date already; merging them is stable (like sorting) and cheaper
+        return {
+            year: list(heapq.merge(*fristen_by_label, key=lambda fwa: fwa.date))
+            for year, fristen_by_label in fristen_by_year_and_label.items()
+        }
 
-    def create_ical_event(self, frist: FristWithAttributes | FristWithAttributesAndType) -> Event:
+    def _create_ical_summary(self, frist: FristWithAttributes | FristWithAttributesAndType) -> str:
         """
-        Create an ical (v)event for a given frist
+        Create the summary of the ical event for a given frist, e.g. "42WT (⭐10)"
         """
-        event = Event()  # type: ignore[no-untyped-call]
         summary: str = frist.label
         if frist.ref_not_in_the_same_month is not None:
             summary += f" (⭐{frist.ref_not_in_the_same_month})"
-        event.add("summary", summary)
+        return summary
+
+    def _create_ical_dtstamp(self) -> datetime:
+        """
+        Create the dtstamp of an ical event (the current time in UTC, see clock)
+        """
+        return self._clock()
+
+    def _create_ical_uid(self, frist: FristWithAttributes | FristWithAttributesAndType) -> str:
+        """
+        Create the UID of the ical event for a given frist.
+        The Fristen of a combined calendar (FristWithAttributesAndTypes) always get stable UIDs, because the
+        creation-date based ones are not unique for them.
+        """
+        if self._stable_uids or isinstance(frist, FristWithAttributesAndTypes):
+            return _create_stable_ical_uid(frist)
+        # UID: YYYYMMDD<type><label><year><month> of the Fristenmonat; the month of the date isn't unique,
+        # e.g. the 21WT Fristen of the Fristenmonate November and December 2022 are both in December 2022
+        creation_date = self._clock().strftime("%Y%m%d")
+        return f"{creation_date}{_create_stable_ical_uid(frist)}"
+
+    def create_ical_event(self, frist: FristWithAttributes | FristWithAttributesAndType) -> "Event":
+        """
+        Create an ical (v)event for a given frist
+        """
+        from icalendar import Event  # noqa: PLC0415 # icalendar is imported lazily because it's slow to import
+
+        event = Event()  # type: ignore[no-untyped-call]
+        event.add("summary", self._create_ical_summary(frist))
         event.add("description", self.generate_frist_description(frist.date, frist.label))
         event.add("dtstart", frist.date)
         event.add("transp", "TRANSPARENT")
-        if sys.version_info >= (3, 11):
-            event.add("dtstamp", datetime.now(UTC))
-        else:
-            event.add("dtstamp", datetime.utcnow())
-
-        # UID: YYYYMMDD<type><label><date>
-        creation_date = datetime.now().strftime("%Y%m%d")
-        frist_type_attr = getattr(frist, "frist_type", None)
-        frist_type = frist_type_attr.value if isinstance(frist_type_attr, FristenType) else "ALL"
-        frist_date = frist.date.strftime("%Y%m")
-        label_clean = frist.label.replace("WT", "").replace("L", "L0")
-        uid = f"{creation_date}{frist_type}{label_clean}{frist_date}"
-        event.add("uid", uid)
-
-        event.add("categories", frist.label)
+        event.add("dtstamp", self._create_ical_dtstamp())
+        event.add("uid", self._create_ical_uid(frist))
+
+        event.add("categories", _get_ical_categories(frist))
         # pylint:disable=line-too-long
         # https://learn.microsoft.com/en-us/openspecs/exchange_server_protocols/ms-oxcical/1c64465c-7d88-4b0f-988f-6e40a289c57f
         # Note that categories is not part of the official ICAL standard but microsoft specific.
 
+        self._count("events_built")
+        return event
+
+    def serialize_ical_event(self, frist: FristWithAttributes | FristWithAttributesAndType) -> bytes:
+        """
+        Serialize the ical (v)event for a given frist directly, without creating an icalendar Event first.
+        The result is the same as create_ical_event(frist).to_ical() but much faster.
+        """
+        self._count("events_built")
+        return serialize_vevent(
+            summary=self._create_ical_summary(frist),
+            description=self.generate_frist_description(frist.date, frist.label),
+            dtstart=frist.date,
+            dtstamp=self._create_ical_dtstamp(),
+            uid=self._create_ical_uid(frist),
+            categories=_get_ical_categories(frist),
+        )
+
+    def _create_ical_series_uid(self, series: Sequence[FristWithAttributes | FristWithAttributesAndType]) -> str:
+        """
+        Create the UID of the ical event for a series of Fristen.
+        It's always derived from the type(s), the label and the Fristenmonat of the first Frist of the series (even
+        without stable_uids): the first Fristen of the series of a calendar are in different Fristenmonate, so the
+        series never share a UID.
+        """
+        return _create_stable_ical_uid(series[0]) + "R"
+
+    def create_ical_series_event(self, series: Sequence[FristWithAttributes | FristWithAttributesAndType]) -> "Event":
+        """
+        Create one recurring ical (v)event for a series of Fristen (see _group_fristen_into_series): the first Frist is
+        the DTSTART, the dates of all others are listed as RDATE.
+        """
+        from icalendar import Event  # noqa: PLC0415 # icalendar is imported lazily because it's slow to import
+
+        first_frist = series[0]
+        event = Event()  # type: ignore[no-untyped-call]
+        event.add("summary", self._create_ical_summary(first_frist))
+        event.add("description", _render_series_description(first_frist.label, first_frist.ref_not_in_the_same_month))
+        event.add("dtstart", first_frist.date)
+        event.add("transp", "TRANSPARENT")
+        event.add("dtstamp", self._create_ical_dtstamp())
+        event.add("uid", self._create_ical_series_uid(series))
+        if len(series) > 1:
+            event.add("rdate", [frist.date for frist in series[1:]])
+        event.add("categories", _get_ical_categories(first_frist))
+
+        self._count("events_built")
         return event
 
-    def create_ical(self, attendee: str, fristen: list[FristWithAttributes | FristWithAttributesAndType]) -> Calendar:
+    def serialize_ical_series_event(self, series: Sequence[FristWithAttributes | FristWithAttributesAndType]) -> bytes:
+        """
+        Serialize the recurring ical (v)event for a series of Fristen directly, without creating an icalendar Event.
+        The result is the same as create_ical_series_event(series).to_ical() but much faster.
+        """
+        first_frist = series[0]
+        self._count("events_built")
+        return serialize_vevent(
+            summary=self._create_ical_summary(first_frist),
+            description=_render_series_description(first_frist.label, first_frist.ref_not_in_the_same_month),
+            dtstart=first_frist.date,
+            dtstamp=self._create_ical_dtstamp(),
+            uid=self._create_ical_series_uid(series),
+            categories=_get_ical_categories(first_frist),
+            rdates=[frist.date for frist in series[1:]],
+        )
+
+    def create_ical(
+        self, attendee: str, fristen: list[FristWithAttributes | FristWithAttributesAndType], compact: bool = False
+    ) -> "Calendar":
         """
-        Create an ical calendar with a given mail address and a given set of fristen
+        Create an ical calendar with a given mail address and a given set of fristen.
+        If compact is set, the calendar contains one recurring event per series of Fristen (i.e. per type, label and
+        ref_not_in_the_same_month) instead of one event per Frist. This shrinks multi-year calendars a lot, but the
+        descriptions of the events no longer name the year of each Frist.
         """
+        with self._measure("build_ical"):
+            calendar = self._create_empty_ical(attendee)
+
+            if compact:
+                for series in _group_fristen_into_series(fristen):
+                    calendar.add_component(self.create_ical_series_event(series))
+            else:
+                for frist in fristen:
+                    calendar.add_component(self.create_ical_event(frist))
+
+        return calendar
+
+    def _create_empty_ical(self, attendee: str) -> "Calendar":
+        """
+        Create an ical calendar with a given mail address but without any events
+        """
+        from icalendar import Calendar  # noqa: PLC0415 # icalendar is imported lazily because it's slow to import
+
         calendar = Calendar()  # type: ignore[no-untyped-call]
         calendar.add("attendee", attendee)
         calendar.add("x-wr-calname", "Hochfrequenz Fristenkalender")
         # https://learn.microsoft.com/en-us/openspecs/exchange_server_protocols/ms-oxcical/1da58449-b97e-46bd-b018-a1ce576f3e6d
-
-        for frist in fristen:
-            calendar.add_component(self.create_ical_event(frist))
-
         return calendar
 
-    def export_ical(self, file_path: Path, cal: Calendar) -> None:
+    def export_ical(self, file_path: Path, cal: "Calendar") -> None:
         """
         Write .ics file from calendar
         """
-        with open(file_path, "wb") as file:
-            file.write(cal.to_ical())
+        with self._measure("serialize_ical"):
+            serialized_calendar = cal.to_ical()
+        with self._measure("write_ical"), open(file_path, "wb") as file:
+            file.write(serialized_calendar)
+        self._count("bytes_written", len(serialized_calendar))
+
+    def serialize_ical_header(self, attendee: str) -> bytes:
+        """
+        Serializes the beginning of an ical calendar with a given mail address, i.e. everything before the first event.
+        The calendar has to be completed with the events and ICAL_FOOTER.
+        """
+        header: bytes = self._create_empty_ical(attendee).to_ical()
+        if not header.endswith(ICAL_FOOTER):
+            raise ValueError(f"The calendar is expected to end with {ICAL_FOOTER!r}")
+        return header[: -len(ICAL_FOOTER)]
+
+    def iter_ical_chunks(
+        self,
+        attendee: str,
+        fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+        use_fast_serializer: bool = False,
+        compact: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        Serializes an ical calendar with a given mail address and a given set of fristen piece by piece:
+        First the calendar header, then one VEVENT per frist and finally the calendar footer.
+        The concatenated chunks are the same bytes as create_ical(attendee, fristen, compact).to_ical() but neither the
+        whole calendar nor all events have to be kept in memory at once (fristen might as well be a generator).
+        If use_fast_serializer is set, the events are serialized by serialize_ical_event instead of icalendar.
+        If compact is set, there is one recurring VEVENT per series of Fristen (see create_ical); the Fristen have to be
+        grouped first, so they are all kept in memory then.
+        """
+        yield self.serialize_ical_header(attendee)
+        if compact:
+            for series in _group_fristen_into_series(fristen):
+                if use_fast_serializer:
+                    yield self.serialize_ical_series_event(series)
+                else:
+                    yield self.create_ical_series_event(series).to_ical()
+            yield ICAL_FOOTER
+            return
+        for frist in fristen:
+            if use_fast_serializer:
+                yield self.serialize_ical_event(frist)
+            else:
+                yield self.create_ical_event(frist).to_ical()
+        yield ICAL_FOOTER
+
+    def export_ical_stream(
+        self,
+        target: Path | BinaryIO,
+        attendee: str,
+        fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+        use_fast_serializer: bool = False,
+        compact: bool = False,
+    ) -> None:
+        """
+        Write an .ics file (or any other binary stream) event by event without building the whole calendar in memory.
+        The result is the same as export_ical(file_path, create_ical(attendee, fristen, compact)).
+        """
+        if isinstance(target, Path):
+            with open(target, "wb") as file:
+                self.export_ical_stream(file, attendee, fristen, use_fast_serializer, compact)
+            return
+        if self._metrics is None:
+            for chunk in self.iter_ical_chunks(attendee, fristen, use_fast_serializer, compact):
+                target.write(chunk)
+            return
+        bytes_written = 0
+        with measure_duration(self._metrics, "export_ical_stream"):
+            for chunk in self.iter_ical_chunks(attendee, fristen, use_fast_serializer, compact):
+                target.write(chunk)
+                bytes_written += len(chunk)
+        self._metrics.increment("bytes_written", bytes_written)
 
     def generate_and_export_fristen_for_type(
         self, file_path: Path, attendee: str, year: int, fristen_type: FristenType
@@ -430,6 +1275,18 @@ class FristenkalenderGenerator:
         calendar = self.create_ical(attendee, fristen_for_type)  # type: ignore[arg-type]
         self.export_ical(file_path, calendar)
 
+    def generate_and_export_combined_calendar(
+        self, file_path: Path, attendee: str, year: int, fristen_types: Iterable[FristenType]
+    ) -> None:
+        """
+        Generates the combined calendar of the given types (see generate_combined_fristen_for_types) and exports it to
+        an .ics file: one event per Frist, whose categories are its label and all its types and whose UID is stable
+        (see FristKey.to_ical_uid)
+        """
+        combined_fristen = self.generate_combined_fristen_for_types(year, fristen_types)
+        calendar = self.create_ical(attendee, list(combined_fristen))
+        self.export_ical(file_path, calendar)
+
     def generate_and_export_whole_calendar(self, file_path: Path, attendee: str, year: int) -> None:
         """
         Generates a calendar for a given year and exports it to an .ics file
@@ -437,3 +1294,12 @@ class FristenkalenderGenerator:
         all_fristen = self.generate_all_fristen(year)
         calendar = self.create_ical(attendee, all_fristen)
         self.export_ical(file_path, calendar)
+
+    def generate_and_stream_whole_calendar(self, target: Path | BinaryIO, attendee: str, year: int) -> None:
+        """
+        Generates a calendar for a given year and streams it to an .ics file (or binary stream) event by event.
+        This is a memory saving alternative to generate_and_export_whole_calendar.
+        """
+        # without a cache, the Fristen are generated lazily while the events are written
+        all_fristen = self.generate_all_fristen(year) if self._cache is not None else self.iter_fristen(year)
+        self.export_ical_stream(target, attendee, all_fristen)
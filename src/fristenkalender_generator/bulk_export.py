@@ -0,0 +1,170 @@
+"""
+This module can export many .ics files (e.g. for many attendees, years and fristen types) at once.
+Each distinct set of Fristen is generated and serialized only once; the files are written by a thread or process pool.
+"""
+
+import dataclasses
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Literal
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    ICAL_FOOTER,
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportJob:
+    """
+    A single .ics file that shall be exported
+    """
+
+    file_path: Path  #: where the .ics file is written to
+    attendee: str  #: the mail address of the recipient
+    year: int  #: the year of the calendar
+    fristen_type: FristenType | None = None  #: None for the whole calendar (see generate_and_export_whole_calendar)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportJobResult:
+    """
+    The outcome of an ExportJob
+    """
+
+    job: ExportJob
+    error: BaseException | None = None  #: None if the file has been written successfully
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        true if and only if the file has been written successfully
+        """
+        return self.error is None
+
+
+ProgressCallback = Callable[[ExportJobResult, int, int], None]
+"""
+called once per finished job with the result, the number of finished jobs and the total number of jobs
+"""
+
+
+_EventsKey = tuple[int, FristenType | None]
+"""
+the year and fristen type of a serialized set of events
+"""
+
+_serialized_events_of_worker_process: dict[_EventsKey, bytes] = {}
+"""
+the serialized events in a worker process of the process pool (set once per process by _init_worker_process)
+"""
+
+
+def _write_calendar(file_path: Path, header: bytes, events: bytes) -> None:
+    """
+    writes a single .ics file
+    """
+    with open(file_path, "wb") as file:
+        file.write(header)
+        file.write(events)
+        file.write(ICAL_FOOTER)
+
+
+def _init_worker_process(serialized_events: dict[_EventsKey, bytes]) -> None:
+    """
+    the initializer of the process pool: the serialized events are sent to each worker process only once
+    (instead of once per job)
+    """
+    _serialized_events_of_worker_process.update(serialized_events)
+
+
+def _write_calendar_in_worker_process(file_path: Path, header: bytes, events_key: _EventsKey) -> None:
+    """
+    writes a single .ics file with events that have been sent to the worker process by _init_worker_process
+    """
+    _write_calendar(file_path, header, _serialized_events_of_worker_process[events_key])
+
+
+def _generate_fristen(
+    generator: FristenkalenderGenerator, year: int, fristen_type: FristenType | None
+) -> list[FristWithAttributes] | list[FristWithAttributesAndType]:
+    if fristen_type is None:
+        return generator.generate_all_fristen(year)
+    return generator.generate_fristen_for_type(year, fristen_type)
+
+
+def export_calendars(
+    jobs: Iterable[ExportJob],
+    generator: FristenkalenderGenerator | None = None,
+    executor_type: Literal["thread", "process"] = "thread",
+    max_workers: int | None = None,
+    progress_callback: ProgressCallback | None = None,
+) -> list[ExportJobResult]:
+    """
+    Exports one .ics file per job. The result of job i is at position i of the returned list.
+    The Fristen (and their VEVENTs) are generated and serialized once per distinct (year, fristen type) and shared by
+    all jobs with the same year and type; only the writing of the files is fanned out to the pool of max_workers
+    threads or processes (executor_type). A process pool receives the serialized events once per worker process.
+    A failing job doesn't stop the other jobs; instead, the error is reported in its result.
+    """
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    results: list[ExportJobResult | None] = [None] * len(jobs)
+    number_of_finished_jobs = 0
+
+    def _finish(job_index: int, error: BaseException | None) -> None:
+        nonlocal number_of_finished_jobs
+        result = ExportJobResult(job=jobs[job_index], error=error)
+        results[job_index] = result
+        number_of_finished_jobs += 1
+        if progress_callback is not None:
+            progress_callback(result, number_of_finished_jobs, len(jobs))
+
+    serialized_events: dict[_EventsKey, bytes | BaseException] = {}
+    for job in jobs:
+        key = (job.year, job.fristen_type)
+        if key not in serialized_events:
+            try:
+                fristen = _generate_fristen(generator, job.year, job.fristen_type)
+                serialized_events[key] = b"".join(generator.serialize_ical_event(frist) for frist in fristen)
+            except Exception as error:  # pylint:disable=broad-exception-caught
+                serialized_events[key] = error
+
+    executor: Executor
+    if executor_type == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_process,
+            initargs=({key: events for key, events in serialized_events.items() if isinstance(events, bytes)},),
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        futures: dict[Future[None], int] = {}
+        for job_index, job in enumerate(jobs):
+            events_key = (job.year, job.fristen_type)
+            events = serialized_events[events_key]
+            if isinstance(events, BaseException):
+                _finish(job_index, events)
+                continue
+            try:
+                header = generator.serialize_ical_header(job.attendee)
+            except Exception as error:  # pylint:disable=broad-exception-caught
+                _finish(job_index, error)
+                continue
+            if executor_type == "process":
+                future = executor.submit(_write_calendar_in_worker_process, job.file_path, header, events_key)
+            else:
+                future = executor.submit(_write_calendar, job.file_path, header, events)
+            futures[future] = job_index
+        for future in as_completed(futures):
+            _finish(futures[future], future.exception())
+
+    return [result for result in results if result is not None]
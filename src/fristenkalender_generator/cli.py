@@ -0,0 +1,279 @@
+"""
+This module contains the command line interface of the fristenkalender_generator.
+It runs a batch of jobs (years, types, attendees and output formats) from a manifest in one invocation, e.g.:
+
+    fristenkalender manifest.json
+    fristenkalender --manifest-format csv - < manifest.csv
+
+A JSON manifest is a list of objects, a CSV manifest has a header row; both with the following keys:
+- "year" (required)
+- "fristen_type": e.g. "KOV"; empty for the whole calendar
+- "format": "ics" (default), "json" (calendar entries, see utils) or "csv" (calendar entries)
+- "attendee": the mail address of the recipient (required for ics)
+- "output": the path of the output file; "-" (default) for stdout
+
+A failing job doesn't stop the other jobs; it's reported on stderr and the exit code is 1.
+"""
+
+import argparse
+import csv
+import dataclasses
+import io
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal, cast, get_args
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+from fristenkalender_generator.bulk_export import ExportJob, export_calendars
+from fristenkalender_generator.utils import convert_fristen_list_to_calendar_like_dictionary, iterate_calendar_entries
+
+OutputFormat = Literal["ics", "json", "csv"]
+
+STDOUT = "-"
+"""
+the output (and manifest) path that stands for stdout (and stdin)
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestJob:
+    """
+    A single output of the batch
+    """
+
+    year: int
+    fristen_type: FristenType | None = None  #: None for the whole calendar
+    output_format: OutputFormat = "ics"
+    attendee: str | None = None  #: the mail address of the recipient; required for ics
+    output: str = STDOUT  #: the path of the output file or STDOUT
+
+    @classmethod
+    def from_dict(cls, job: dict[str, Any]) -> "ManifestJob":
+        """
+        creates a job from an entry of a manifest; raises a ValueError if the entry is invalid
+        """
+        try:
+            year = int(job["year"])
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Each job requires a valid year: {job}") from error
+        output_format = job.get("format") or "ics"
+        if output_format not in get_args(OutputFormat):
+            raise ValueError(f"The format '{output_format}' is none of {get_args(OutputFormat)}: {job}")
+        attendee = job.get("attendee") or None
+        if output_format == "ics" and attendee is None:
+            raise ValueError(f"An attendee is required for the ics format: {job}")
+        fristen_type_value = job.get("fristen_type") or None
+        return cls(
+            year=year,
+            fristen_type=FristenType(fristen_type_value) if fristen_type_value is not None else None,
+            output_format=cast(OutputFormat, output_format),
+            attendee=attendee,
+            output=job.get("output") or STDOUT,
+        )
+
+
+def read_manifest(manifest: str, manifest_format: Literal["json", "csv"]) -> list[ManifestJob]:
+    """
+    parses a JSON or CSV manifest (see module docstring)
+    """
+    if manifest_format == "csv":
+        entries: Iterable[dict[str, Any]] = csv.DictReader(io.StringIO(manifest))
+    else:
+        entries = json.loads(manifest)
+        if not isinstance(entries, list):
+            raise ValueError("A JSON manifest has to be a list of jobs")
+    return [ManifestJob.from_dict(entry) for entry in entries]
+
+
+def _render_csv(fristen: list[FristWithAttributes]) -> bytes:
+    with io.StringIO() as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerow(["wochentag", "datum", "fristen", "feiertags_name"])
+        for entry in iterate_calendar_entries(fristen):
+            writer.writerow(
+                [entry["wochentag"], entry["datum"], " ".join(entry["fristen"] or []), entry["feiertags_name"] or ""]
+            )
+        return csv_file.getvalue().encode("utf-8")
+
+
+def render_job(
+    generator: FristenkalenderGenerator,
+    job: ManifestJob,
+    fristen: list[FristWithAttributes] | list[FristWithAttributesAndType],
+) -> bytes:
+    """
+    serializes the Fristen of a job in its output format
+    """
+    if job.output_format == "json":
+        calendar_entries = convert_fristen_list_to_calendar_like_dictionary(list(fristen))
+        return json.dumps(calendar_entries, ensure_ascii=False, indent=2).encode("utf-8") + b"\n"
+    if job.output_format == "csv":
+        return _render_csv(list(fristen))
+    if job.attendee is None:
+        raise ValueError(f"An attendee is required for the ics format: {job}")
+    with io.BytesIO() as ics_file:
+        generator.export_ical_stream(ics_file, job.attendee, fristen, use_fast_serializer=True)
+        return ics_file.getvalue()
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestJobResult:
+    """
+    The outcome of a ManifestJob
+    """
+
+    job: ManifestJob
+    output: bytes | None = None  #: the output of a successful job with STDOUT (None for the others)
+    error: BaseException | None = None  #: None if the job succeeded
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        true if and only if the job succeeded
+        """
+        return self.error is None
+
+
+def _is_ics_file_job(job: ManifestJob) -> bool:
+    return job.output_format == "ics" and job.output != STDOUT and job.attendee is not None
+
+
+def _run_jobs_of_year_and_type(
+    generator: FristenkalenderGenerator, jobs: Sequence[ManifestJob]
+) -> list[ManifestJobResult]:
+    """
+    generates the Fristen of jobs with the same year and fristen type once and renders (and writes) all of the jobs
+    """
+    try:
+        if jobs[0].fristen_type is None:
+            fristen: list[Any] = generator.generate_all_fristen(jobs[0].year)
+        else:
+            fristen = generator.generate_fristen_for_type(jobs[0].year, jobs[0].fristen_type)
+    except Exception as error:  # pylint:disable=broad-exception-caught
+        return [ManifestJobResult(job=job, error=error) for job in jobs]
+    results: list[ManifestJobResult] = []
+    for job in jobs:
+        try:
+            output = render_job(generator, job, fristen)
+            if job.output == STDOUT:
+                results.append(ManifestJobResult(job=job, output=output))
+            else:
+                Path(job.output).write_bytes(output)
+                results.append(ManifestJobResult(job=job))
+        except Exception as error:  # pylint:disable=broad-exception-caught
+            results.append(ManifestJobResult(job=job, error=error))
+    return results
+
+
+def run_jobs(
+    jobs: Sequence[ManifestJob], generator: FristenkalenderGenerator | None = None, max_workers: int | None = None
+) -> list[ManifestJobResult]:
+    """
+    Runs the jobs and returns the result of job i at position i.
+    The .ics files are exported by bulk_export.export_calendars, i.e. the events of each distinct (year, fristen type)
+    are serialized only once and the files are written by a thread pool of max_workers threads.
+    Meanwhile, the other jobs (JSON, CSV and everything for STDOUT) are run by a second thread pool of max_workers
+    threads: one task per distinct (year, fristen type), which generates the Fristen once and renders all of its jobs.
+    The outputs for STDOUT are returned, such that they can be written in the order of the jobs.
+    A failing job doesn't stop the other jobs; instead, the error is reported in its result.
+    """
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    results: list[ManifestJobResult | None] = [None] * len(jobs)
+
+    ics_file_job_indices: list[int] = []
+    other_job_indices_by_year_and_type: dict[tuple[int, FristenType | None], list[int]] = {}
+    for job_index, job in enumerate(jobs):
+        if _is_ics_file_job(job):
+            ics_file_job_indices.append(job_index)
+        else:
+            other_job_indices_by_year_and_type.setdefault((job.year, job.fristen_type), []).append(job_index)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (job_indices, executor.submit(_run_jobs_of_year_and_type, generator, [jobs[i] for i in job_indices]))
+            for job_indices in other_job_indices_by_year_and_type.values()
+        ]
+        if ics_file_job_indices:
+            export_jobs = [
+                ExportJob(
+                    file_path=Path(jobs[job_index].output),
+                    attendee=cast(str, jobs[job_index].attendee),  # checked in _is_ics_file_job
+                    year=jobs[job_index].year,
+                    fristen_type=jobs[job_index].fristen_type,
+                )
+                for job_index in ics_file_job_indices
+            ]
+            export_results = export_calendars(export_jobs, generator, max_workers=max_workers)
+            for job_index, export_result in zip(ics_file_job_indices, export_results, strict=True):
+                results[job_index] = ManifestJobResult(job=jobs[job_index], error=export_result.error)
+        for job_indices, future in futures:
+            for job_index, result in zip(job_indices, future.result(), strict=True):
+                results[job_index] = result
+    return [result for result in results if result is not None]
+
+
+def _positive_int(value: str) -> int:
+    """
+    an argparse type for options that have to be a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from error
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"has to be a positive integer: {number}")
+    return number
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    the entry point of the command line interface; returns the exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="fristenkalender", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("manifest", nargs="?", default=STDOUT, help="the path of the manifest; '-' for stdin")
+    parser.add_argument(
+        "--manifest-format",
+        choices=["json", "csv"],
+        help="the format of the manifest; derived from the file extension by default (json for stdin)",
+    )
+    parser.add_argument("--max-workers", type=_positive_int, help="the maximum number of jobs that run in parallel")
+    arguments = parser.parse_args(argv)
+
+    if arguments.manifest == STDOUT:
+        manifest = sys.stdin.read()
+    else:
+        try:
+            manifest = Path(arguments.manifest).read_text(encoding="utf-8")
+        except OSError as error:
+            parser.error(f"cannot read the manifest: {error}")
+    manifest_format: Literal["json", "csv"] = arguments.manifest_format or (
+        "csv" if arguments.manifest.lower().endswith(".csv") else "json"
+    )
+    try:
+        jobs = read_manifest(manifest, manifest_format)
+    except ValueError as error:
+        parser.error(f"invalid manifest: {error}")
+    exit_code = 0
+    for job_number, result in enumerate(run_jobs(jobs, max_workers=arguments.max_workers), start=1):
+        if result.error is not None:
+            print(f"job {job_number} ({result.job}) failed: {result.error!r}", file=sys.stderr)
+            exit_code = 1
+        elif result.output is not None:
+            sys.stdout.buffer.write(result.output)
+    sys.stdout.buffer.flush()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+This module contains memory efficient representations of Fristen.
+Both don't store the description of a Frist but derive it from its label when needed.
+"""
+
+import dataclasses
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import TYPE_CHECKING, Any, overload
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+    FristWithAttributesAndTypes,
+    Label,
+    specific_description,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    import pyarrow as pa
+
+LABELS: tuple[Label, ...] = tuple(FristenkalenderGenerator.get_labels())
+"""
+all labels; the label code of a label is its position in this tuple
+"""
+
+FRISTEN_TYPES: tuple[FristenType, ...] = tuple(FristenType)
+"""
+all fristen types; the type code of a fristen type is its position in this tuple
+"""
+
+_LABEL_CODES: dict[Label, int] = {label: code for code, label in enumerate(LABELS)}
+_FRISTEN_TYPE_CODES: dict[FristenType, int] = {fristen_type: code for code, fristen_type in enumerate(FRISTEN_TYPES)}
+
+NO_REF_MONTH = 0
+"""
+the value that is stored in the ref_months column if the Frist is in the same month as the ref. date
+"""
+
+NO_FRISTEN_TYPE = -1
+"""
+the value that is stored in the fristen_type_codes column if the Frist has no type
+"""
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+"""
+numpy datetime64 and arrow date32 count the days since 1970-01-01
+"""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CompactFrist:
+    """
+    An immutable Frist without a per-instance __dict__ and without a stored description
+    """
+
+    date: date  #: = date(y,m,d)
+    label: Label  #: can be for example '5WT' (5 Werktage des Liefermonats)
+    ref_not_in_the_same_month: int | None  #: see FristWithAttributes
+    fristen_type: FristenType | None = None  #: None for Fristen that are not specific to a type
+
+    @property
+    def description(self) -> str:
+        """
+        the specific description of the Frist (derived from the label)
+        """
+        return specific_description[self.label]
+
+    @classmethod
+    def from_frist(cls, frist: FristWithAttributes | FristWithAttributesAndType) -> "CompactFrist":
+        """
+        creates a compact Frist from a regular one;
+        raises a TypeError for a Frist of a combined calendar (FristWithAttributesAndTypes) with its multiple types
+        """
+        if isinstance(frist, FristWithAttributesAndTypes):
+            raise TypeError(f"A CompactFrist can't represent the multiple types of a combined Frist: {frist}")
+        return cls(
+            date=frist.date,
+            label=frist.label,
+            ref_not_in_the_same_month=frist.ref_not_in_the_same_month,
+            fristen_type=getattr(frist, "fristen_type", None),
+        )
+
+    def to_frist(self) -> FristWithAttributes | FristWithAttributesAndType:
+        """
+        converts the compact Frist back to a regular one
+        """
+        if self.fristen_type is None:
+            return FristWithAttributes(self.date, self.label, self.ref_not_in_the_same_month, self.description)
+        return FristWithAttributesAndType(
+            date=self.date,
+            label=self.label,
+            ref_not_in_the_same_month=self.ref_not_in_the_same_month,
+            description=self.description,
+            fristen_type=self.fristen_type,
+        )
+
+
+class FristenColumns:
+    """
+    A columnar container of Fristen. Each Frist only takes a few bytes:
+    the date ordinal, a label code (see LABELS), the ref. month (NO_REF_MONTH for None) and a fristen type code
+    (see FRISTEN_TYPES, NO_FRISTEN_TYPE for None) are stored in parallel arrays.
+    """
+
+    def __init__(
+        self,
+        ordinals: "array[int] | None" = None,
+        label_codes: "array[int] | None" = None,
+        ref_months: "array[int] | None" = None,
+        fristen_type_codes: "array[int] | None" = None,
+    ) -> None:
+        self.ordinals: array[int] = ordinals if ordinals is not None else array("i")
+        self.label_codes: array[int] = label_codes if label_codes is not None else array("b")
+        self.ref_months: array[int] = ref_months if ref_months is not None else array("b")
+        self.fristen_type_codes: array[int] = fristen_type_codes if fristen_type_codes is not None else array("b")
+        for name, column, typecode in (
+            ("ordinals", self.ordinals, "i"),
+            ("label_codes", self.label_codes, "b"),
+            ("ref_months", self.ref_months, "b"),
+            ("fristen_type_codes", self.fristen_type_codes, "b"),
+        ):
+            if column.typecode != typecode:
+                raise ValueError(f"The column {name} must have the typecode '{typecode}' but has '{column.typecode}'")
+        if not len(self.ordinals) == len(self.label_codes) == len(self.ref_months) == len(self.fristen_type_codes):
+            raise ValueError("All columns must have the same length")
+
+    @classmethod
+    def from_fristen(
+        cls, fristen: Iterable[FristWithAttributes | FristWithAttributesAndType | CompactFrist]
+    ) -> "FristenColumns":
+        """
+        creates the columns from (regular or compact) Fristen (see append)
+        """
+        result = cls()
+        for frist in fristen:
+            result.append(frist)
+        return result
+
+    def append(self, frist: FristWithAttributes | FristWithAttributesAndType | CompactFrist) -> None:
+        """
+        adds a Frist to the end of the columns;
+        raises a TypeError for a Frist of a combined calendar (FristWithAttributesAndTypes) with its multiple types
+        """
+        if isinstance(frist, FristWithAttributesAndTypes):
+            raise TypeError(f"The FristenColumns can't represent the multiple types of a combined Frist: {frist}")
+        fristen_type: FristenType | None = getattr(frist, "fristen_type", None)
+        self.ordinals.append(frist.date.toordinal())
+        self.label_codes.append(_LABEL_CODES[frist.label])
+        ref_month = frist.ref_not_in_the_same_month
+        self.ref_months.append(NO_REF_MONTH if ref_month is None else ref_month)
+        self.fristen_type_codes.append(NO_FRISTEN_TYPE if fristen_type is None else _FRISTEN_TYPE_CODES[fristen_type])
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def _get_frist(self, index: int) -> CompactFrist:
+        ref_month = self.ref_months[index]
+        fristen_type_code = self.fristen_type_codes[index]
+        return CompactFrist(
+            date=date.fromordinal(self.ordinals[index]),
+            label=LABELS[self.label_codes[index]],
+            ref_not_in_the_same_month=None if ref_month == NO_REF_MONTH else ref_month,
+            fristen_type=None if fristen_type_code == NO_FRISTEN_TYPE else FRISTEN_TYPES[fristen_type_code],
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> CompactFrist: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "FristenColumns": ...
+
+    def __getitem__(self, index: int | slice) -> "CompactFrist | FristenColumns":
+        if isinstance(index, slice):
+            return FristenColumns(
+                self.ordinals[index], self.label_codes[index], self.ref_months[index], self.fristen_type_codes[index]
+            )
+        return self._get_frist(index)
+
+    def __iter__(self) -> Iterator[CompactFrist]:
+        return (self._get_frist(index) for index in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FristenColumns):
+            return NotImplemented
+        return (
+            self.ordinals == other.ordinals
+            and self.label_codes == other.label_codes
+            and self.ref_months == other.ref_months
+            and self.fristen_type_codes == other.fristen_type_codes
+        )
+
+    __hash__ = None  # type:ignore[assignment] # mutable container
+
+    def to_fristen(self) -> list[FristWithAttributes | FristWithAttributesAndType]:
+        """
+        converts the columns back to a list of regular Fristen
+        """
+        return [compact_frist.to_frist() for compact_frist in self]
+
+    def _get_days_since_unix_epoch(self) -> "array[int]":
+        return array("i", (ordinal - _UNIX_EPOCH_ORDINAL for ordinal in self.ordinals))
+
+    def to_numpy(self) -> dict[str, "npt.NDArray[Any]"]:
+        """
+        Returns the columns as numpy arrays (requires the optional dependency numpy):
+        - "date": datetime64[D] array
+        - "label": int8 label codes (categories: LABELS), e.g. for pandas.Categorical.from_codes
+        - "ref_not_in_the_same_month": masked int8 array (masked where the Frist is in the same month)
+        - "fristen_type": int8 type codes (categories: FRISTEN_TYPES, -1 for Fristen without type)
+        Except for the dates, the arrays are views on the buffers of the columns (no copy). Hence, no Fristen can be
+        appended to the columns as long as the arrays are in use.
+        """
+        try:
+            import numpy as np  # noqa: PLC0415
+        except ImportError as import_error:
+            raise ImportError(
+                "numpy is required for to_numpy; install it with: pip install fristenkalender_generator[numpy]"
+            ) from import_error
+        return {
+            "date": np.frombuffer(self._get_days_since_unix_epoch(), dtype=np.int32).astype("datetime64[D]"),
+            "label": np.frombuffer(self.label_codes, dtype=np.int8),
+            "ref_not_in_the_same_month": np.ma.masked_equal(
+                np.frombuffer(self.ref_months, dtype=np.int8), NO_REF_MONTH, copy=False
+            ),
+            "fristen_type": np.frombuffer(self.fristen_type_codes, dtype=np.int8),
+        }
+
+    def to_arrow(self) -> "pa.Table":
+        """
+        Returns the columns as arrow table (requires the optional dependency pyarrow): "date" (date32), "label" and
+        "fristen_type" (both dictionary encoded) and "ref_not_in_the_same_month" (int8 with nulls where the Frist is in
+        the same month).
+        Except for the dates (which are converted to days since the unix epoch), the arrow arrays use the buffers of
+        the columns (no copy); only validity bitmaps are added for the nulls. Hence, no Fristen can be appended to the
+        columns as long as the table is in use.
+        """
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+            import pyarrow.compute as pc  # noqa: PLC0415
+        except ImportError as import_error:
+            raise ImportError(
+                "pyarrow is required for to_arrow; install it with: pip install fristenkalender_generator[arrow]"
+            ) from import_error
+        length = len(self)
+
+        def _int8_array(column: "array[int]", null_value: int | None = None) -> "pa.Array":
+            data = pa.py_buffer(column)
+            if null_value is None:
+                return pa.Array.from_buffers(pa.int8(), length, [None, data])
+            # a boolean array is a bitmap, i.e. it can be used as validity bitmap of the (unchanged) data
+            is_valid = pc.not_equal(pa.Array.from_buffers(pa.int8(), length, [None, data]), null_value)
+            return pa.Array.from_buffers(pa.int8(), length, [is_valid.buffers()[1], data])
+
+        return pa.table(
+            {
+                "date": pa.Array.from_buffers(
+                    pa.date32(), length, [None, pa.py_buffer(self._get_days_since_unix_epoch())]
+                ),
+                "label": pa.DictionaryArray.from_arrays(_int8_array(self.label_codes), pa.array(LABELS)),
+                "ref_not_in_the_same_month": _int8_array(self.ref_months, NO_REF_MONTH),
+                "fristen_type": pa.DictionaryArray.from_arrays(
+                    _int8_array(self.fristen_type_codes, NO_FRISTEN_TYPE),
+                    pa.array([fristen_type.value for fristen_type in FRISTEN_TYPES]),
+                ),
+            }
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
@@ -0,0 +1,135 @@
+"""
+This module contains a reverse index of the Fristen: it answers "is this date a Frist and which?" in O(1).
+"""
+
+import dataclasses
+from array import array
+from collections.abc import Iterator
+from datetime import date
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    FristenkalenderGenerator,
+    FristenType,
+    Label,
+)
+from fristenkalender_generator.compact_fristen import LABELS
+
+
+@dataclasses.dataclass(frozen=True)
+class FristenOfDate:
+    """
+    All Fristen on a date
+    """
+
+    date: date
+    labels: tuple[Label, ...]  #: the labels of all Fristen on this date (in the order of the calendar)
+    fristen_types: tuple[FristenType, ...]  #: the types of all Fristen on this date
+
+
+_FRISTEN_TYPES_BY_LABEL: dict[Label, tuple[FristenType, ...]] = {
+    label: tuple(
+        fristen_type for fristen_type in FristenType if label in FristenkalenderGenerator.get_labels(fristen_type)
+    )
+    for label in LABELS
+}
+
+
+class FristenDateIndex:
+    """
+    A compact index of all Fristen from January 1st of first_year until December 31st of last_year (inclusive).
+    It stores one 16 bit mask of label codes (see compact_fristen.LABELS) per day, i.e. less than 1kB per year, and
+    looks up the Fristen of a date (or date ordinal) in O(1).
+    """
+
+    def __init__(self, first_year: int, last_year: int, generator: FristenkalenderGenerator | None = None) -> None:
+        if first_year > last_year:
+            raise ValueError(f"first_year ({first_year}) must not be after last_year ({last_year})")
+        if generator is None:
+            generator = FristenkalenderGenerator()
+        self.first_year: int = first_year
+        self.last_year: int = last_year
+        self._first_ordinal = date(first_year, 1, 1).toordinal()
+        self._end_ordinal = date(last_year + 1, 1, 1).toordinal()
+        self._label_masks = array("H", bytes(2 * (self._end_ordinal - self._first_ordinal)))
+        label_bits = {label: 1 << code for code, label in enumerate(LABELS)}
+        for frist in generator.fristen_between(date(first_year, 1, 1), date(last_year, 12, 31)):
+            self._label_masks[frist.date.toordinal() - self._first_ordinal] |= label_bits[frist.label]
+        self._labels_by_mask: dict[int, tuple[Label, ...]] = {}
+        """
+        the decoded label masks; there are only a few distinct combinations of labels on one day
+        """
+
+    def _get_offset(self, day: date | int) -> int:
+        ordinal = day if isinstance(day, int) else day.toordinal()
+        if not self._first_ordinal <= ordinal < self._end_ordinal:
+            raise ValueError(f"The date {day} is outside of the index ({self.first_year}-{self.last_year})")
+        return ordinal - self._first_ordinal
+
+    def _get_labels(self, mask: int) -> tuple[Label, ...]:
+        labels = self._labels_by_mask.get(mask)
+        if labels is None:
+            labels = tuple(label for code, label in enumerate(LABELS) if mask & (1 << code))
+            self._labels_by_mask[mask] = labels
+        return labels
+
+    def _create_fristen_of_date(self, offset: int, mask: int) -> FristenOfDate:
+        labels = self._get_labels(mask)
+        fristen_types = {fristen_type for label in labels for fristen_type in _FRISTEN_TYPES_BY_LABEL[label]}
+        return FristenOfDate(
+            date=date.fromordinal(self._first_ordinal + offset),
+            labels=labels,
+            fristen_types=tuple(fristen_type for fristen_type in FristenType if fristen_type in fristen_types),
+        )
+
+    def __contains__(self, day: object) -> bool:
+        """
+        Returns true if there is at least one Frist on the given date (or date ordinal); false for dates outside of
+        the index
+        """
+        if not isinstance(day, (date, int)):
+            return False
+        ordinal = day if isinstance(day, int) else day.toordinal()
+        if not self._first_ordinal <= ordinal < self._end_ordinal:
+            return False
+        return self._label_masks[ordinal - self._first_ordinal] != 0
+
+    def get_labels(self, day: date | int) -> tuple[Label, ...]:
+        """
+        Returns the labels of all Fristen on the given date (or date ordinal); empty if there is no Frist.
+        This is the cheapest lookup; it doesn't create any objects.
+        """
+        return self._get_labels(self._label_masks[self._get_offset(day)])
+
+    def get(self, day: date | int) -> FristenOfDate | None:
+        """
+        Returns the Fristen on the given date (or date ordinal) or None if there is no Frist
+        """
+        offset = self._get_offset(day)
+        mask = self._label_masks[offset]
+        if mask == 0:
+            return None
+        return self._create_fristen_of_date(offset, mask)
+
+    def __getitem__(self, dates: slice) -> Iterator[FristenOfDate]:
+        """
+        index[start:end] is index.between(start, end), i.e. the end is inclusive;
+        a missing start (end) is the first (last) date of the index
+        """
+        if not isinstance(dates, slice):
+            raise TypeError(f"The index can only be sliced by dates (use get for a single date): {dates!r}")
+        if dates.step is not None:
+            raise ValueError(f"The index can't be sliced with a step: {dates!r}")
+        start: date = date(self.first_year, 1, 1) if dates.start is None else dates.start
+        end: date = date(self.last_year, 12, 31) if dates.stop is None else dates.stop
+        return self.between(start, end)
+
+    def between(self, start: date, end: date) -> Iterator[FristenOfDate]:
+        """
+        Yields the Fristen of all dates from start to end (both inclusive) that have at least one Frist
+        """
+        start_offset = self._get_offset(start)
+        end_offset = self._get_offset(end)
+        for offset in range(start_offset, end_offset + 1):
+            mask = self._label_masks[offset]
+            if mask != 0:
+                yield self._create_fristen_of_date(offset, mask)
@@ -0,0 +1,122 @@
+"""
+This module contains an on-disk cache of generated Fristen.
+The Fristen of a year (and type) are fully determined by the versions of this library, bdew_datetimes and holidays.
+Hence, they can be stored once and loaded (instead of recomputed) by later processes, e.g. on serverless cold starts.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+from fristenkalender_generator.compact_fristen import FristenColumns
+
+_MAGIC = b"FKG1"
+_HEADER = struct.Struct("<4sI")
+"""
+the header of each cache file: the magic bytes and the number of Fristen (little endian)
+"""
+
+
+def _get_version(distribution_name: str) -> str:
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415 # slow to import
+
+    try:
+        return version(distribution_name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _get_cache_key() -> str:
+    """
+    returns a string that changes whenever one of the packages that determine the Fristen is updated
+    """
+    versions = [_get_version(name) for name in ("fristenkalender_generator", "bdew_datetimes", "holidays")]
+    return "_".join(versions).replace("/", "-")
+
+
+def _to_little_endian(column: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> "array[int]":
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class FristenCache:
+    """
+    A directory that contains one binary file per year and fristen type.
+    Each file consists of a small header and the columns of FristenColumns as little endian arrays (int32 date
+    ordinals, int8 label codes, int8 ref. months, int8 type codes), so it's compact and can be memory mapped.
+    The files are stored in a subdirectory per version of this library, bdew_datetimes and holidays.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir / _get_cache_key()
+
+    def _get_path(self, year: int, fristen_type: FristenType | None) -> Path:
+        return self.cache_dir / f"{year}_{fristen_type.value if fristen_type is not None else 'ALL'}.bin"
+
+    def load(
+        self, year: int, fristen_type: FristenType | None
+    ) -> list[FristWithAttributes | FristWithAttributesAndType] | None:
+        """
+        Returns the cached Fristen of the given year and type (None for all Fristen) or None if they're not cached.
+        """
+        path = self._get_path(year, fristen_type)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, length = _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + 7 * length:
+            return None  # the file is corrupt or has an outdated format; it'll be overwritten
+        offset = _HEADER.size
+        ordinals = _from_little_endian("i", data[offset : offset + 4 * length])
+        offset += 4 * length
+        label_codes, ref_months, fristen_type_codes = (
+            _from_little_endian("b", data[offset + i * length : offset + (i + 1) * length]) for i in range(3)
+        )
+        return FristenColumns(ordinals, label_codes, ref_months, fristen_type_codes).to_fristen()
+
+    def store(
+        self,
+        year: int,
+        fristen_type: FristenType | None,
+        fristen: list[FristWithAttributes] | list[FristWithAttributesAndType],
+    ) -> None:
+        """
+        Stores the Fristen of the given year and type (None for all Fristen).
+        """
+        columns = FristenColumns.from_fristen(fristen)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(year, fristen_type)
+        # write to a temporary file first, such that concurrent readers never see a half written file
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, len(columns)))
+                file.write(_to_little_endian(columns.ordinals))
+                file.write(columns.label_codes.tobytes())
+                file.write(columns.ref_months.tobytes())
+                file.write(columns.fristen_type_codes.tobytes())
+            os.replace(temporary_path, path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
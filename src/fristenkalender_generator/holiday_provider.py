@@ -0,0 +1,105 @@
+"""
+This module contains a process-wide cache of the BDEW holidays.
+Creating the BDEW calendar (and populating it year by year) is expensive; with the provider it happens once per
+process (and year) instead of once per call.
+"""
+
+import threading
+from collections.abc import Callable, Mapping
+from datetime import date
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from holidays import HolidayBase
+
+
+def _create_bdew_calendar() -> "HolidayBase":
+    # bdew_datetimes (and holidays) are imported lazily because they're slow to import
+    from bdew_datetimes import create_bdew_calendar  # noqa: PLC0415
+
+    return create_bdew_calendar()
+
+
+class HolidayProvider:
+    """
+    A thread-safe cache of BDEW holidays (date ⟶ name of the holiday), populated year by year on demand.
+    """
+
+    def __init__(self, calendar_factory: Callable[[], "HolidayBase"] = _create_bdew_calendar) -> None:
+        """
+        calendar_factory creates the (dict-like) holiday calendar; defaults to bdew_datetimes.create_bdew_calendar
+        """
+        self._calendar_factory = calendar_factory
+        self._lock = threading.Lock()
+        self._calendar: HolidayBase | None = None
+        self._holidays_by_year: dict[int, Mapping[date, str]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        a counter that is increased with every invalidation; used to detect data derived from outdated holidays
+        """
+        return self._generation
+
+    def invalidate(self) -> None:
+        """
+        Discards all cached holidays, e.g. after bdew_datetimes has been updated with a new (special) holiday.
+        """
+        with self._lock:
+            self._calendar = None
+            self._holidays_by_year = {}
+            self._generation += 1
+
+    def _get_holidays_of_year(self, year: int) -> Mapping[date, str]:
+        """
+        returns the (cached) holidays of the given year; the caller has to hold the lock
+        """
+        holidays_of_year = self._holidays_by_year.get(year)
+        if holidays_of_year is None:
+            if self._calendar is None:
+                self._calendar = self._calendar_factory()
+            self._calendar.get(date(year, 1, 1))  # populates the holidays of the entire year
+            # only the (few) holidays of this year are sorted, not all holidays that have been populated so far
+            unsorted_holidays = [
+                (holiday_date, holiday_name)
+                for holiday_date, holiday_name in self._calendar.items()
+                if holiday_date.year == year
+            ]
+            holidays_of_year = MappingProxyType(dict(sorted(unsorted_holidays)))
+            self._holidays_by_year[year] = holidays_of_year
+        return holidays_of_year
+
+    def get_holidays(self, first_year: int, last_year: int) -> dict[date, str]:
+        """
+        Returns all holidays from first_year to last_year (both inclusive) sorted by date.
+        """
+        result: dict[date, str] = {}
+        with self._lock:
+            for year in range(first_year, last_year + 1):
+                result.update(self._get_holidays_of_year(year))
+        return result
+
+    def get_holiday_names(self, first_date: date, last_date: date) -> dict[date, str]:
+        """
+        Returns all holidays from first_date to last_date (both inclusive) sorted by date.
+        """
+        return {
+            holiday_date: holiday_name
+            for holiday_date, holiday_name in self.get_holidays(first_date.year, last_date.year).items()
+            if first_date <= holiday_date <= last_date
+        }
+
+    def is_holiday(self, candidate: date) -> bool:
+        """
+        Returns true if and only if the candidate is a BDEW holiday
+        """
+        with self._lock:
+            return candidate in self._get_holidays_of_year(candidate.year)
+
+
+bdew_holiday_provider = HolidayProvider()
+"""
+the holiday provider that is shared by all FristenkalenderGenerators and the utils (unless specified otherwise)
+"""
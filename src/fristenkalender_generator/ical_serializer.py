@@ -0,0 +1,108 @@
+"""
+This module contains a fast serializer for the (fixed) shape of the Fristen VEVENTs.
+It writes the RFC 5545 text directly instead of building icalendar objects first.
+The output is byte-for-byte the same as icalendar.Event.to_ical() for the same properties.
+"""
+
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+
+_FOLD_LIMIT = 75
+"""
+lines should not be longer than 75 octets (excluding the line break), see RFC 5545 section 3.1
+"""
+
+_LINE_BREAK = b"\r\n"
+_FOLD_SEPARATOR = b"\r\n "
+_ESCAPE_BYTES = b"\\^"
+
+
+def _escape_text(text: str) -> str:
+    """
+    Escapes a TEXT value according to RFC 5545 section 3.3.11 (the same way icalendar does)
+    """
+    # the order of the replacements matters
+    return (
+        text.replace(r"\N", "\n")
+        .replace("\\", "\\\\")
+        .replace(";", r"\;")
+        .replace(",", r"\,")
+        .replace("\r\n", r"\n")
+        .replace("\n", r"\n")
+        .replace("\r", r"\n")
+    )
+
+
+def _fold_line(line: str) -> bytes:
+    """
+    Encodes a content line and folds it such that no line is longer than 75 octets (RFC 5545 section 3.1).
+    Like icalendar, neither a multi byte character nor an escape sequence (backslash) is split across two lines.
+    """
+    data = line.encode("utf-8")
+    if len(data) < _FOLD_LIMIT:
+        return data  # fast path: most of the lines are short enough
+    folded_lines: list[bytes] = []
+    start = 0
+    while len(data) - start >= _FOLD_LIMIT:
+        end = start + _FOLD_LIMIT - 1
+        while data[end] & 0b1100_0000 == 0b1000_0000:  # don't split UTF-8 continuation bytes from their first byte
+            end -= 1
+        if end - start > 1 and data[end - 1] in _ESCAPE_BYTES:
+            end -= 1
+        folded_lines.append(data[start:end])
+        start = end
+    folded_lines.append(data[start:])
+    return _FOLD_SEPARATOR.join(folded_lines)
+
+
+def _format_date(value: date) -> str:
+    """
+    Formats a DATE value (RFC 5545 section 3.3.4)
+    """
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+def _format_dtstamp(dtstamp: datetime) -> str:
+    """
+    Formats a naive or UTC datetime as UTC DATE-TIME value (RFC 5545 section 3.8.7.2).
+    Like icalendar, a naive datetime is assumed to be in UTC already.
+    """
+    if dtstamp.tzinfo is None or dtstamp.utcoffset() == timedelta(0):
+        return dtstamp.strftime("%Y%m%dT%H%M%SZ")
+    raise ValueError(f"The dtstamp has to be either naive or in UTC but was {dtstamp}")
+
+
+def serialize_vevent(
+    summary: str,
+    description: str,
+    dtstart: date,
+    dtstamp: datetime,
+    uid: str,
+    categories: str | list[str],
+    transp: str = "TRANSPARENT",
+    rdates: Sequence[date] = (),
+) -> bytes:
+    """
+    Serializes a VEVENT with the given properties.
+    The properties are written in the same order as icalendar writes them (canonical order first, then alphabetical).
+    rdates are the additional dates of a recurring event (RFC 5545 section 3.8.5.2); none for a single event.
+    """
+    if isinstance(categories, str):
+        categories = [categories]
+    content_lines = [
+        "BEGIN:VEVENT",
+        "SUMMARY:" + _escape_text(summary),
+        "DTSTART;VALUE=DATE:" + _format_date(dtstart),
+        "DTSTAMP:" + _format_dtstamp(dtstamp),
+        "UID:" + _escape_text(uid),
+    ]
+    if rdates:
+        content_lines.append("RDATE;VALUE=DATE:" + ",".join(_format_date(rdate) for rdate in rdates))
+    content_lines += [
+        "CATEGORIES:" + ",".join(_escape_text(category) for category in categories),
+        "DESCRIPTION:" + _escape_text(description),
+        "TRANSP:" + _escape_text(transp),
+        "END:VEVENT",
+        "",
+    ]
+    return _LINE_BREAK.join(_fold_line(content_line) for content_line in content_lines)
@@ -0,0 +1,147 @@
+"""
+This module can update a previously generated calendar after the rules changed (e.g. bdew_datetimes added a new
+holiday or a label was added to the calendar) without regenerating it from scratch.
+The result is a changeset of added, moved and removed Fristen, which can be pushed to calendar clients as minimal
+update; the Fristen are identified by their FristKey, so the UIDs of moved events stay the same.
+"""
+
+import dataclasses
+from collections.abc import Iterable
+from datetime import date
+
+from fristenkalender_generator.bdew_calendar_generator import (
+    FristenkalenderGenerator,
+    FristenType,
+    FristKey,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+    Label,
+    get_frist_key,
+    get_frist_sort_key,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class MovedFrist:
+    """
+    A Frist whose date changed
+    """
+
+    previous: FristWithAttributes | FristWithAttributesAndType
+    current: FristWithAttributes | FristWithAttributesAndType
+
+    @property
+    def key(self) -> FristKey:
+        """
+        the (unchanged) key of the Frist
+        """
+        return get_frist_key(self.current)
+
+
+@dataclasses.dataclass(frozen=True)
+class FristenChangeset:
+    """
+    The differences between two versions of a calendar
+    """
+
+    added: list[FristWithAttributes | FristWithAttributesAndType] = dataclasses.field(default_factory=list)
+    moved: list[MovedFrist] = dataclasses.field(default_factory=list)
+    removed: list[FristWithAttributes | FristWithAttributesAndType] = dataclasses.field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.moved or self.removed)
+
+    def apply_to(
+        self, previous_fristen: Iterable[FristWithAttributes | FristWithAttributesAndType]
+    ) -> list[FristWithAttributes | FristWithAttributesAndType]:
+        """
+        Returns the updated calendar, sorted by date (and label) like the result of generate_all_fristen
+        """
+        fristen_by_key = {get_frist_key(frist): frist for frist in previous_fristen}
+        for frist in self.removed:
+            del fristen_by_key[get_frist_key(frist)]
+        for moved_frist in self.moved:
+            fristen_by_key[moved_frist.key] = moved_frist.current
+        for frist in self.added:
+            fristen_by_key[get_frist_key(frist)] = frist
+        return sorted(fristen_by_key.values(), key=get_frist_sort_key)
+
+
+def _diff(
+    previous_by_key: dict[FristKey, FristWithAttributes | FristWithAttributesAndType],
+    current_by_key: dict[FristKey, FristWithAttributes | FristWithAttributesAndType | None],
+) -> FristenChangeset:
+    """
+    compares the previous Fristen with the current ones (None for Fristen that no longer exist); only the keys of
+    current_by_key are compared
+    """
+    changeset = FristenChangeset()
+    for key, current_frist in current_by_key.items():
+        previous_frist = previous_by_key.get(key)
+        if previous_frist is None:
+            if current_frist is not None:
+                changeset.added.append(current_frist)
+        elif current_frist is None:
+            changeset.removed.append(previous_frist)
+        elif current_frist != previous_frist:
+            changeset.moved.append(MovedFrist(previous_frist, current_frist))
+    return changeset
+
+
+def diff_fristen(
+    previous_fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+    current_fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+) -> FristenChangeset:
+    """
+    Compares two versions of a calendar (e.g. two results of generate_all_fristen for the same year)
+    """
+    previous_by_key = {get_frist_key(frist): frist for frist in previous_fristen}
+    current_by_key: dict[FristKey, FristWithAttributes | FristWithAttributesAndType | None] = dict.fromkeys(
+        previous_by_key
+    )
+    current_by_key.update((get_frist_key(frist), frist) for frist in current_fristen)
+    return _diff(previous_by_key, current_by_key)
+
+
+def regenerate_fristen(
+    previous_fristen: Iterable[FristWithAttributes | FristWithAttributesAndType],
+    year: int,
+    changed_dates: Iterable[date] = (),
+    changed_labels: Iterable[Label] = (),
+    fristen_type: FristenType | None = None,
+    generator: FristenkalenderGenerator | None = None,
+) -> FristenChangeset:
+    """
+    Updates a previously generated calendar of the given year (the result of generate_all_fristen or, if a
+    fristen_type is given, generate_fristen_for_type) and returns the changes. Only the affected Fristen are recomputed:
+    - changed_dates are dates that became (or are no longer) holidays; the Fristen whose working days might include
+      one of these dates are recomputed
+    - changed_labels are labels whose rules changed (e.g. 3LWT if _24H_LFW_KEY_DATE moved); all their Fristen are
+      recomputed
+    - labels that don't occur in the previous calendar are generated entirely; Fristen with labels that are no
+      longer part of the calendar are removed
+    The generator must already use the new holidays (see HolidayProvider.invalidate).
+    """
+    if generator is None:
+        generator = FristenkalenderGenerator()
+    previous_by_key = {get_frist_key(frist): frist for frist in previous_fristen}
+    labels = generator.get_labels(fristen_type)
+    current_labels = set(labels)
+    labels_to_regenerate = set(changed_labels) | (current_labels - {key.label for key in previous_by_key})
+    changed_dates = list(changed_dates)
+
+    current_by_key: dict[FristKey, FristWithAttributes | FristWithAttributesAndType | None] = {
+        key: None for key in previous_by_key if key.label not in current_labels
+    }
+    for label in labels:
+        fristenmonate = generator.get_fristenmonate(year, label)
+        if label not in labels_to_regenerate:
+            affected_fristenmonate: set[tuple[int, int]] = set()
+            for changed_date in changed_dates:
+                affected_fristenmonate |= generator.get_fristenmonate_depending_on(changed_date, label)
+            fristenmonate = [fristenmonat for fristenmonat in fristenmonate if fristenmonat in affected_fristenmonate]
+        for fristenmonat in fristenmonate:
+            current_by_key[FristKey(fristen_type, label, *fristenmonat)] = generator.generate_frist_for_fristenmonat(
+                year, fristenmonat, label, fristen_type
+            )
+    return _diff(previous_by_key, current_by_key)
@@ -0,0 +1,83 @@
+"""
+This module contains the optional instrumentation of the FristenkalenderGenerator.
+If a MetricsSink is passed to the generator, it reports the following durations (in seconds) and counters:
+
+durations:
+- "build_working_day_index": looking up the holidays and building the working day index
+- "generate_fristen": calculating the Fristen (generate_specific_fristen_for_range and everything built upon it)
+- "build_ical": building the icalendar objects (create_ical)
+- "serialize_ical": serializing an icalendar calendar (export_ical)
+- "write_ical": writing a serialized calendar to a file (export_ical)
+- "export_ical_stream": serializing and writing a calendar event by event (export_ical_stream)
+
+counters:
+- "working_day_index_years": the number of years covered by the built working day indices
+- "fristen_generated": the number of calculated Fristen
+- "cache_hits"/"cache_misses": the lookups in the FristenCache (if the generator has one)
+- "events_built": the number of created or serialized ical events
+- "bytes_written": the number of bytes written by export_ical and export_ical_stream
+
+Without a sink, the instrumentation is skipped entirely.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Protocol
+
+
+class MetricsSink(Protocol):
+    """
+    Receives the metrics of a FristenkalenderGenerator, e.g. to forward them to a monitoring system.
+    The methods might be called from multiple threads at once.
+    """
+
+    def increment(self, name: str, value: int) -> None:
+        """
+        increments the counter with the given name by value
+        """
+
+    def record_duration(self, name: str, seconds: float) -> None:
+        """
+        records the duration of a phase with the given name
+        """
+
+
+@contextmanager
+def measure_duration(sink: MetricsSink, name: str) -> Iterator[None]:
+    """
+    records the duration of the with block in the sink
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink.record_duration(name, time.perf_counter() - start)
+
+
+class InMemoryMetricsSink:
+    """
+    A thread-safe MetricsSink that keeps all metrics in memory, e.g. for profiling or tests
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.durations: defaultdict[str, list[float]] = defaultdict(list)
+
+    def increment(self, name: str, value: int) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def record_duration(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[name].append(seconds)
+
+    def get_total_duration(self, name: str) -> float:
+        """
+        returns the sum of all recorded durations with the given name (in seconds)
+        """
+        with self._lock:
+            return sum(self.durations.get(name, []))
@@ -2,14 +2,12 @@
 utility functions
 """
 
-from collections.abc import Mapping
-from datetime import datetime, timedelta
-from itertools import groupby
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date
 from typing import Literal, TypedDict
 
-from bdew_datetimes import create_bdew_calendar
-
 from fristenkalender_generator.bdew_calendar_generator import FristWithAttributes
+from fristenkalender_generator.holiday_provider import bdew_holiday_provider
 
 _DeutscherWochentag = Literal["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
 
@@ -23,6 +21,11 @@ weekday_mapping: Mapping[str, _DeutscherWochentag] = {  # Mapping of %A weekdays
     "Sunday": "So",
 }
 
+_wochentage: tuple[_DeutscherWochentag, ...] = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+"""
+the German weekday abbreviations, indexed by date.weekday()
+"""
+
 
 class _CalendarEntry(TypedDict):
     """
@@ -35,30 +38,33 @@ class _CalendarEntry(TypedDict):
     feiertags_name: str | None  # e.g. "Ostermontag"
 
 
+def iterate_calendar_entries(fristen: Iterable[FristWithAttributes]) -> Iterator[_CalendarEntry]:
+    """
+    Yields one calendar entry per day, from the date of the first until the date of the last Frist, in date order.
+    The Fristen don't have to be sorted; the labels of Fristen on the same day keep their order.
+    """
+    labels_by_date: dict[date, list[str]] = {}
+    for frist in fristen:
+        labels_by_date.setdefault(frist.date, []).append(frist.label)
+    if not labels_by_date:
+        return
+    first_date = min(labels_by_date)
+    last_date = max(labels_by_date)
+    holiday_names = bdew_holiday_provider.get_holiday_names(first_date, last_date)
+    weekday = first_date.weekday()
+    for ordinal in range(first_date.toordinal(), last_date.toordinal() + 1):
+        current_date = date.fromordinal(ordinal)
+        yield _CalendarEntry(
+            wochentag=_wochentage[weekday],
+            datum=current_date.isoformat(),
+            fristen=labels_by_date.get(current_date, None),
+            feiertags_name=holiday_names.get(current_date, None),
+        )
+        weekday = (weekday + 1) % 7
+
+
 def convert_fristen_list_to_calendar_like_dictionary(fristen: list[FristWithAttributes]) -> dict[str, _CalendarEntry]:
     """
     Sorts the list of Fristen by date such that they can be read like a calendar.
     """
-    _bdew_holidays = create_bdew_calendar()  # this behaves like a dict
-    result: dict[str, _CalendarEntry] = {}
-    for frist_date, matching_fristen in groupby(sorted(fristen, key=lambda fwa: fwa.date), key=lambda fwa: fwa.date):
-        result[frist_date.isoformat()] = _CalendarEntry(
-            wochentag=weekday_mapping[frist_date.strftime("%A")],
-            datum=frist_date.isoformat(),
-            fristen=[fwa.label for fwa in matching_fristen],
-            feiertags_name=_bdew_holidays.get(frist_date.isoformat(), None),
-        )
-    current_date = min(f.date for f in fristen)
-    max_date = max(f.date for f in fristen)
-    while current_date <= max_date:
-        german_str = current_date.isoformat()
-        if german_str not in result:
-            result[german_str] = _CalendarEntry(
-                wochentag=weekday_mapping[current_date.strftime("%A")],
-                datum=german_str,
-                fristen=None,
-                feiertags_name=_bdew_holidays.get(current_date.isoformat(), None),
-            )
-        current_date += timedelta(days=1)
-    result = dict(sorted(result.items(), key=lambda item: datetime.strptime(item[0], "%Y-%m-%d")))  # re-sort
-    return result
+    return {entry["datum"]: entry for entry in iterate_calendar_entries(fristen)}
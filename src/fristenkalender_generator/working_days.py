@@ -0,0 +1,206 @@
+"""
+This module contains a precomputed index of BDEW working days (Werktage).
+It allows to look up the nth WT and nth LWT of a month without scanning the holiday calendar again and again.
+"""
+
+from array import array
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from fristenkalender_generator.holiday_provider import HolidayProvider, bdew_holiday_provider
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    import numpy.typing as npt
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+"""
+numpy datetime64 counts the days since 1970-01-01
+"""
+
+
+def _import_numpy() -> "ModuleType":
+    """
+    imports the optional dependency numpy, which is only required for the vectorized working day arithmetic
+    """
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as import_error:
+        raise ImportError(
+            "numpy is required for vectorized working day arithmetic; install it with: "
+            "pip install fristenkalender_generator[numpy]"
+        ) from import_error
+    return numpy
+
+
+class WorkingDayIndex:
+    """
+    A sorted array of all BDEW working days in a range of (full) years plus the offset of the first working day of
+    each month inside this array and the number of working days before each day (prefix sums).
+    The index is built once (one pass over all days of the years) and then answers all lookups in O(1).
+    """
+
+    def __init__(self, first_year: int, last_year: int, holiday_provider: HolidayProvider | None = None) -> None:
+        """
+        Builds the index for all days from January 1st of first_year until December 31st of last_year (inclusive).
+        The holidays are taken from the holiday_provider (defaults to the shared bdew_holiday_provider).
+        """
+        if first_year > last_year:
+            raise ValueError(f"first_year ({first_year}) must not be after last_year ({last_year})")
+        if holiday_provider is None:
+            holiday_provider = bdew_holiday_provider
+        self.first_year: int = first_year
+        self.last_year: int = last_year
+        self.holiday_generation: int = holiday_provider.generation
+        """
+        the generation of the holiday provider at the time the index was built
+        """
+        holidays = holiday_provider.get_holidays(first_year, last_year)
+        self._working_days: list[date] = []
+        self._month_offsets: list[int] = []
+        """
+        _month_offsets[i] is the position of the first working day of the i-th month (counted from January of
+        first_year) in _working_days. The last entry is a sentinel (= len(_working_days)).
+        """
+        self._working_days_before = array("i")
+        """
+        _working_days_before[i] is the number of working days before the i-th day (counted from January 1st of
+        first_year). The last entry is a sentinel (= len(_working_days)).
+        """
+        current_date = date(first_year, 1, 1)
+        self._first_ordinal = current_date.toordinal()
+        end_date = date(last_year + 1, 1, 1)
+        one_day = timedelta(days=1)
+        while current_date < end_date:
+            if current_date.day == 1:
+                self._month_offsets.append(len(self._working_days))
+            self._working_days_before.append(len(self._working_days))
+            # working days are all days that are neither saturday, sunday nor a BDEW holiday
+            if current_date.weekday() < 5 and current_date not in holidays:
+                self._working_days.append(current_date)
+            current_date += one_day
+        self._month_offsets.append(len(self._working_days))
+        self._working_days_before.append(len(self._working_days))
+        self._numpy_arrays: tuple[Any, Any] | None = None
+        """
+        _working_days (as days since the unix epoch) and _working_days_before as numpy arrays; created on demand
+        """
+
+    def covers(self, first_year: int, last_year: int) -> bool:
+        """
+        Returns true if the index contains all days of the years first_year to last_year (both inclusive)
+        """
+        return self.first_year <= first_year and last_year <= self.last_year
+
+    def _month_offset(self, year: int, month: int) -> int:
+        month_index = (year - self.first_year) * 12 + month - 1
+        if not 0 <= month_index < len(self._month_offsets) - 1:
+            raise ValueError(f"The month {year}-{month:02d} is not covered by the index ({self})")
+        return self._month_offsets[month_index]
+
+    def _working_day_at(self, position: int) -> date:
+        if not 0 <= position < len(self._working_days):
+            raise ValueError(f"The requested working day is not covered by the index ({self})")
+        return self._working_days[position]
+
+    def get_nth_working_day_of_month(self, nth_day: int, year: int, month: int) -> date:
+        """
+        Returns the nth working day (WT) of the given month; same as
+        bdew_datetimes.periods.get_nth_working_day_of_month(nth_day, start=date(year, month, 1)).
+        The result might be in one of the following months, if nth_day is larger than the number of working days.
+        """
+        if nth_day < 1:
+            raise ValueError(f"nth_day must be positive but was {nth_day}")
+        return self._working_day_at(self._month_offset(year, month) + nth_day - 1)
+
+    def get_nth_last_working_day_of_month(self, nth_day: int, year: int, month: int) -> date:
+        """
+        Returns the nth last working day (LWT) of the given month.
+        For nth_day == 0 this is the last working day of the month.
+        Otherwise, the last day of the month is counted irrespective if it's a working day or not (and hence is
+        excluded) and the nth working day before the last day of the month is returned.
+        """
+        if nth_day < 0:
+            raise ValueError(f"nth_day must not be negative but was {nth_day}")
+        if month == 12:
+            end_offset = self._month_offset_or_end(year + 1, 1)
+        else:
+            end_offset = self._month_offset(year, month + 1)
+        if nth_day == 0:
+            return self._working_day_at(end_offset - 1)
+        last_date_of_month = date(year, month, monthrange(year, month)[1])
+        if end_offset > 0 and self._working_days[end_offset - 1] == last_date_of_month:
+            end_offset -= 1  # the last day of the month itself is never counted
+        return self._working_day_at(end_offset - nth_day)
+
+    def _get_day_index(self, day: date) -> int:
+        day_index = day.toordinal() - self._first_ordinal
+        if not 0 <= day_index < len(self._working_days_before) - 1:
+            raise ValueError(f"The date {day} is not covered by the index ({self})")
+        return day_index
+
+    def add_working_days(self, day: date, offset: int) -> date:
+        """
+        Returns the offset-th working day after (offset > 0) or before (offset < 0) the given day, e.g.
+        add_working_days(day, 1) is the next working day after the day and add_working_days(day, -10) is the 10th
+        working day before the day. The day itself is never counted; an offset of 0 returns the day unchanged.
+        """
+        if offset == 0:
+            return day
+        day_index = self._get_day_index(day)
+        if offset > 0:
+            return self._working_day_at(self._working_days_before[day_index + 1] + offset - 1)
+        return self._working_day_at(self._working_days_before[day_index] + offset)
+
+    def _get_numpy_arrays(self) -> tuple[Any, Any]:
+        if self._numpy_arrays is None:
+            np = _import_numpy()
+            working_days = np.fromiter(
+                (working_day.toordinal() - _UNIX_EPOCH_ORDINAL for working_day in self._working_days),
+                dtype=np.int64,
+                count=len(self._working_days),
+            )
+            self._numpy_arrays = (working_days, np.frombuffer(self._working_days_before, dtype=np.int32))
+        return self._numpy_arrays
+
+    def add_working_days_to_dates(self, dates: "npt.ArrayLike", offsets: "npt.ArrayLike") -> "npt.NDArray[Any]":
+        """
+        Vectorized variant of add_working_days (requires the optional dependency numpy): shifts each date by the
+        respective offset (in working days); dates and offsets are broadcast against each other.
+        Returns a datetime64[D] array; NaT (not a time) dates stay NaT.
+        """
+        np = _import_numpy()
+        working_days, working_days_before = self._get_numpy_arrays()
+        dates_array, day_offsets = np.broadcast_arrays(
+            np.asarray(dates, dtype="datetime64[D]"), np.asarray(offsets, dtype=np.int64)
+        )
+        is_nat = np.isnat(dates_array)
+        days = dates_array.astype(np.int64)
+        # NaT is looked up as the first day of the index; it's replaced by NaT again in the end
+        day_indices = np.where(is_nat, 0, days - (self._first_ordinal - _UNIX_EPOCH_ORDINAL))
+        if np.any((day_indices < 0) | (day_indices >= len(working_days_before) - 1)):
+            raise ValueError(f"Some dates are not covered by the index ({self})")
+        positions = np.where(
+            day_offsets > 0,
+            working_days_before[day_indices + 1] + day_offsets - 1,
+            working_days_before[day_indices] + day_offsets,
+        )
+        is_shifted = (day_offsets != 0) & ~is_nat
+        if np.any(is_shifted & ((positions < 0) | (positions >= len(working_days)))):
+            raise ValueError(f"Some of the requested working days are not covered by the index ({self})")
+        shifted_days = np.where(is_shifted, working_days[np.where(is_shifted, positions, 0)], days)
+        result: npt.NDArray[Any] = np.where(is_nat, dates_array, shifted_days.astype("datetime64[D]"))
+        return result
+
+    def _month_offset_or_end(self, year: int, month: int) -> int:
+        """
+        like _month_offset but returns the sentinel for the first month after the covered range
+        """
+        if year == self.last_year + 1 and month == 1:
+            return self._month_offsets[-1]
+        return self._month_offset(year, month)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(first_year={self.first_year}, last_year={self.last_year})"
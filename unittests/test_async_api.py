@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType
+from fristenkalender_generator.async_api import (
+    aiter_ical_chunks,
+    async_generate_and_export_fristen_for_type,
+    async_generate_and_export_whole_calendar,
+)
+
+
+def _create_generator() -> FristenkalenderGenerator:
+    # a fixed clock, such that the DTSTAMPs (and UIDs) of different exports are equal
+    return FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+
+
+async def _collect_chunks(
+    generator: FristenkalenderGenerator, attendee: str, year: int, events_per_chunk: int
+) -> list[bytes]:
+    fristen = generator.generate_all_fristen(year)
+    return [chunk async for chunk in aiter_ical_chunks(attendee, fristen, generator, events_per_chunk)]
+
+
+class TestAsyncApi:
+    def test_aiter_ical_chunks(self) -> None:
+        generator = _create_generator()
+        fristen = generator.generate_all_fristen(2024)
+        chunks = asyncio.run(_collect_chunks(generator, "mail@test.de", 2024, events_per_chunk=10))
+
+        assert len(chunks) == 1 + -(-len(fristen) // 10) + 1  # header, events, footer
+        assert b"".join(chunks) == generator.create_ical("mail@test.de", fristen).to_ical()
+
+    def test_aiter_ical_chunks_from_a_lazy_iterator(self) -> None:
+        generator = _create_generator()
+
+        async def collect() -> list[bytes]:
+            return [chunk async for chunk in aiter_ical_chunks("mail@test.de", generator.iter_fristen(2024), generator)]
+
+        chunks = asyncio.run(collect())
+        expected = generator.create_ical("mail@test.de", generator.generate_all_fristen(2024)).to_ical()
+        assert b"".join(chunks) == expected
+
+    @pytest.mark.parametrize("events_per_chunk", [0, -1])
+    def test_aiter_ical_chunks_with_invalid_chunk_size(self, events_per_chunk: int) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(_collect_chunks(_create_generator(), "mail@test.de", 2024, events_per_chunk))
+
+    def test_async_generate_and_export_whole_calendar(self, tmp_path: Path) -> None:
+        generator = _create_generator()
+        asyncio.run(async_generate_and_export_whole_calendar(tmp_path / "async.ics", "mail@test.de", 2025, generator))
+        generator.generate_and_export_whole_calendar(tmp_path / "sync.ics", "mail@test.de", 2025)
+        assert (tmp_path / "async.ics").read_bytes() == (tmp_path / "sync.ics").read_bytes()
+
+    def test_async_generate_and_export_fristen_for_type(self, tmp_path: Path) -> None:
+        generator = _create_generator()
+        asyncio.run(
+            async_generate_and_export_fristen_for_type(
+                tmp_path / "async.ics", "mail@test.de", 2025, FristenType.KOV, generator
+            )
+        )
+        generator.generate_and_export_fristen_for_type(tmp_path / "sync.ics", "mail@test.de", 2025, FristenType.KOV)
+        assert (tmp_path / "async.ics").read_bytes() == (tmp_path / "sync.ics").read_bytes()
@@ -1,4 +1,6 @@
-from datetime import date
+import io
+import re
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Union
 
@@ -14,6 +16,7 @@ from fristenkalender_generator import (
     FristWithAttributesAndType,
     Label,
 )
+from fristenkalender_generator.bdew_calendar_generator import get_frist_key, get_frist_sort_key
 
 
 class TestFristenkalenderGenerator:
@@ -399,3 +402,266 @@ class TestFristenkalenderGenerator:
         generator = FristenkalenderGenerator()
         actual = generator.generate_all_fristen_for_given_lwt(year, 0, "LWT")
         assert expected in [f.date for f in actual]
+
+    def test_generate_all_fristen_for_range(self) -> None:
+        actual = FristenkalenderGenerator().generate_all_fristen_for_range(2022, 2026)
+        assert list(actual.keys()) == [2022, 2023, 2024, 2025, 2026]
+        for year, fristen in actual.items():
+            assert fristen == FristenkalenderGenerator().generate_all_fristen(year)
+
+    @pytest.mark.parametrize("fristen_type", list(FristenType))
+    def test_generate_fristen_for_type_for_range(self, fristen_type: FristenType) -> None:
+        actual = FristenkalenderGenerator().generate_fristen_for_type_for_range(2023, 2026, fristen_type)
+        for year, fristen in actual.items():
+            assert fristen == FristenkalenderGenerator().generate_fristen_for_type(year, fristen_type)
+
+    def test_generate_all_fristen_for_invalid_range(self) -> None:
+        with pytest.raises(ValueError):
+            FristenkalenderGenerator().generate_all_fristen_for_range(2024, 2023)
+
+    @pytest.mark.parametrize("use_fast_serializer", [True, False])
+    def test_export_ical_stream_equals_export_ical(self, tmp_path: Path, use_fast_serializer: bool) -> None:
+        attendee = "mail@test.de"
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+        fristen = generator.generate_all_fristen(2024)
+        expected_path = tmp_path / "expected.ics"
+        generator.export_ical(expected_path, generator.create_ical(attendee, fristen))
+        stream = io.BytesIO()
+        generator.export_ical_stream(stream, attendee, (frist for frist in fristen), use_fast_serializer)
+        assert stream.getvalue() == expected_path.read_bytes()
+
+    def test_generate_and_stream_whole_calendar(self, tmp_path: Path) -> None:
+        my_file = tmp_path / "2023.ics"
+        FristenkalenderGenerator().generate_and_stream_whole_calendar(my_file, "mail@test.de", 2023)
+
+        content = my_file.read_bytes()
+        assert content.startswith(b"BEGIN:VCALENDAR\r\n")
+        assert content.endswith(b"END:VCALENDAR\r\n")
+        assert content.count(b"BEGIN:VEVENT") == len(FristenkalenderGenerator().generate_all_fristen(2023))
+
+    def test_generate_frist_description_is_shared(self) -> None:
+        first = FristenkalenderGenerator().generate_frist_description(date(2023, 9, 12), "3LWT")
+        second = FristenkalenderGenerator().generate_frist_description(date(2023, 9, 27), "3LWT")
+        assert first is second
+        assert "3. letzter Werktag des Fristenmonats September 2023" in first
+
+    @pytest.mark.parametrize("use_fast_serializer", [True, False])
+    def test_reproducible_export(self, use_fast_serializer: bool) -> None:
+        def create_export() -> bytes:
+            generator = FristenkalenderGenerator(
+                clock=lambda: datetime(2025, 1, 8, 15, 25, 57, tzinfo=timezone.utc), stable_uids=True
+            )
+            stream = io.BytesIO()
+            fristen = generator.generate_fristen_for_type(2024, FristenType.KOV)
+            generator.export_ical_stream(stream, "mail@test.de", fristen, use_fast_serializer)
+            return stream.getvalue()
+
+        first_export = create_export()
+        assert first_export == create_export()
+        assert b"DTSTAMP:20250108T152557Z" in first_export
+        assert b"UID:KOV5202401\r\n" in first_export
+
+    def test_create_ical_event_uid(self) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+        frist = generator.generate_fristen_for_type(2024, FristenType.GELI)[0]
+        assert generator.create_ical_event(frist)["UID"] == "20250108GELI16" + frist.date.strftime("%Y%m")
+
+    @pytest.mark.parametrize("year", [2023, 2024, 2025])
+    def test_default_ical_uids_are_unique(self, year: int) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+        fristen = generator.generate_all_fristen(year)
+        assert len({generator.create_ical_event(frist)["UID"] for frist in fristen}) == len(fristen)
+
+    @pytest.mark.parametrize("year", [2023, 2024, 2025, 2026])
+    def test_fristen_between_whole_year(self, year: int) -> None:
+        generator = FristenkalenderGenerator()
+        expected = [frist for frist in generator.generate_all_fristen(year) if frist.date.year == year]
+        assert list(generator.fristen_between(date(year, 1, 1), date(year, 12, 31))) == expected
+
+    @pytest.mark.parametrize("fristen_type", list(FristenType))
+    def test_fristen_between_for_type(self, fristen_type: FristenType) -> None:
+        generator = FristenkalenderGenerator()
+        fristen_for_type = sorted(generator.generate_fristen_for_type(2024, fristen_type), key=lambda frist: frist.date)
+        expected = [frist for frist in fristen_for_type if date(2024, 3, 10) <= frist.date <= date(2024, 7, 3)]
+        actual = list(generator.fristen_between(date(2024, 3, 10), date(2024, 7, 3), fristen_types=[fristen_type]))
+        assert actual == expected
+
+    def test_fristen_between_multiple_types(self) -> None:
+        actual = list(
+            FristenkalenderGenerator().fristen_between(
+                date(2024, 5, 1), date(2024, 5, 14), fristen_types=[FristenType.KOV, FristenType.MABIS], labels=["5WT"]
+            )
+        )
+        assert all(isinstance(frist, FristWithAttributesAndType) for frist in actual)
+        assert [
+            (frist.label, frist.fristen_type) for frist in actual if isinstance(frist, FristWithAttributesAndType)
+        ] == [
+            ("5WT", FristenType.MABIS),
+            ("5WT", FristenType.KOV),
+        ]
+
+    @pytest.mark.parametrize(
+        "after, label, fristen_type, expected",
+        [
+            pytest.param(date(2024, 1, 1), "12WT", None, date(2024, 1, 17)),
+            pytest.param(date(2024, 1, 17), "12WT", None, date(2024, 2, 16)),
+            pytest.param(date(2023, 12, 28), None, None, date(2023, 12, 29)),
+            pytest.param(date(2024, 1, 1), "16WT", FristenType.GELI, date(2024, 1, 23)),
+            pytest.param(date(2025, 6, 6), "3LWT", None, None),
+        ],
+    )
+    def test_next_frist(
+        self, after: date, label: Label | None, fristen_type: FristenType | None, expected: date | None
+    ) -> None:
+        actual = FristenkalenderGenerator().next_frist(after, label, fristen_type)
+        assert (actual.date if actual is not None else None) == expected
+
+    @pytest.mark.parametrize("year", [2024, 2025])
+    def test_generate_fristen_for_types(self, year: int) -> None:
+        generator = FristenkalenderGenerator()
+        actual = generator.generate_fristen_for_types(year, list(FristenType))
+        assert [frist.date for frist in actual] == sorted(frist.date for frist in actual)
+        for fristen_type in FristenType:
+            expected = sorted(generator.generate_fristen_for_type(year, fristen_type), key=lambda frist: frist.date)
+            assert [frist for frist in actual if frist.fristen_type == fristen_type] == expected
+
+    def test_generate_fristen_for_types_shares_labels(self) -> None:
+        actual = FristenkalenderGenerator().generate_fristen_for_types(2024, [FristenType.KOV, FristenType.MABIS])
+        fristen_on_date = [(frist.label, frist.fristen_type) for frist in actual if frist.date == date(2024, 5, 8)]
+        assert fristen_on_date == [("5WT", FristenType.MABIS), ("5WT", FristenType.KOV), ("26WT", FristenType.KOV)]
+
+    def test_generate_fristen_for_types_for_range(self) -> None:
+        generator = FristenkalenderGenerator()
+        actual = generator.generate_fristen_for_types_for_range(2023, 2025, [FristenType.GELI, FristenType.GPKE])
+        for year, fristen in actual.items():
+            assert fristen == generator.generate_fristen_for_types(year, [FristenType.GPKE, FristenType.GELI])
+
+    @pytest.mark.parametrize("year", [2023, 2024, 2025, 2026])
+    def test_iter_fristen(self, year: int) -> None:
+        generator = FristenkalenderGenerator()
+        assert list(generator.iter_fristen(year)) == generator.generate_all_fristen(year)
+
+    def test_iter_fristen_for_range_and_labels(self) -> None:
+        generator = FristenkalenderGenerator()
+        actual = list(generator.iter_fristen(range(2024, 2026), labels=["LWT", "5WT"]))
+        expected = [
+            frist
+            for year in range(2024, 2026)
+            for frist in generator.generate_all_fristen(year)
+            if frist.label in {"LWT", "5WT"}
+        ]
+        assert actual == expected
+
+    def test_iter_fristen_with_unknown_label(self) -> None:
+        with pytest.raises(ValueError):
+            next(FristenkalenderGenerator().iter_fristen(2024, labels=["7WT"]))  # type: ignore[list-item]
+
+    @pytest.mark.parametrize("use_fast_serializer", [True, False])
+    def test_compact_export_contains_all_fristen(self, use_fast_serializer: bool) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc), stable_uids=True)
+        fristen = [frist for year in range(2024, 2027) for frist in generator.generate_all_fristen(year)]
+        stream = io.BytesIO()
+        generator.export_ical_stream(stream, "mail@test.de", fristen, use_fast_serializer, compact=True)
+
+        events = stream.getvalue().replace(b"\r\n ", b"").decode("utf-8").split("BEGIN:VEVENT")[1:]
+        actual: set[tuple[str, date]] = set()
+        for event in events:
+            properties = dict(line.split(":", 1) for line in event.splitlines() if ":" in line)
+            dates = [properties["DTSTART;VALUE=DATE"], *properties.get("RDATE;VALUE=DATE", "").split(",")]
+            actual.update(
+                (properties["CATEGORIES"], datetime.strptime(ical_date, "%Y%m%d").date())
+                for ical_date in dates
+                if ical_date
+            )
+            assert "2025" not in properties["DESCRIPTION"]
+        assert actual == {(frist.label, frist.date) for frist in fristen}
+        assert len(events) < len(fristen) / 5
+        assert stream.getvalue() == generator.create_ical("mail@test.de", fristen, compact=True).to_ical()
+
+    def test_compact_export_series(self) -> None:
+        generator = FristenkalenderGenerator(stable_uids=True)
+        fristen = generator.generate_fristen_for_type(2024, FristenType.GELI)
+        calendar = generator.create_ical("mail@test.de", fristen, compact=True)  # type: ignore[arg-type]
+        events = {str(event["SUMMARY"]): event for event in calendar.walk("VEVENT")}
+        assert set(events) == {
+            "16WT" if frist.ref_not_in_the_same_month is None else f"16WT (⭐{frist.ref_not_in_the_same_month})"
+            for frist in fristen
+        }
+        assert events["16WT"]["UID"] == "GELI16202312R"
+        assert "16. Werktag des jeweiligen Fristenmonats" in str(events["16WT"]["DESCRIPTION"])
+
+    @pytest.mark.parametrize("year", [2024, 2025, 2026])
+    def test_compact_export_series_uids_are_unique(self, year: int) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+        calendar = generator.create_ical("mail@test.de", list(generator.generate_all_fristen(year)), compact=True)
+        uids = [str(event["UID"]) for event in calendar.walk("VEVENT")]
+        assert len(uids) == len(set(uids))
+
+    def test_compact_export_series_with_star(self) -> None:
+        generator = FristenkalenderGenerator()
+        fristen = [frist for frist in generator.generate_all_fristen(2025) if frist.label == "42WT"]
+        calendar = generator.create_ical("mail@test.de", list(fristen), compact=True)
+        events = {str(event["SUMMARY"]): event for event in calendar.walk("VEVENT")}
+        # the 42nd WT of the Fristenmonat November is in January
+        assert "42WT (⭐10)" in events
+        assert "42. Werktag des Fristenmonats November" in str(events["42WT (⭐10)"]["DESCRIPTION"])
+        frist = next(frist for frist in fristen if frist.ref_not_in_the_same_month == 10)
+        assert get_frist_key(frist).month == 11
+
+    @pytest.mark.parametrize("year", [2024, 2025])
+    def test_generate_combined_fristen_for_types(self, year: int) -> None:
+        generator = FristenkalenderGenerator()
+        fristen_types = [FristenType.KOV, FristenType.MABIS, FristenType.GELI]
+        expected: dict[tuple[date, str], list[FristenType]] = {}
+        for frist in generator.generate_fristen_for_types(year, fristen_types):
+            expected.setdefault((frist.date, frist.label), []).append(frist.fristen_type)
+
+        actual = generator.generate_combined_fristen_for_types(year, fristen_types)
+
+        assert {(frist.date, frist.label): list(frist.fristen_types) for frist in actual} == expected
+        assert len(actual) == len(expected)
+        assert [frist.date for frist in actual] == sorted(frist.date for frist in actual)
+
+    @pytest.mark.parametrize("use_fast_serializer", [True, False])
+    def test_combined_export(self, use_fast_serializer: bool) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc), stable_uids=True)
+        fristen = generator.generate_combined_fristen_for_types(2024, [FristenType.MABIS, FristenType.KOV])
+        stream = io.BytesIO()
+        generator.export_ical_stream(stream, "mail@test.de", fristen, use_fast_serializer)
+
+        content = stream.getvalue()
+        assert content.count(b"BEGIN:VEVENT") == len(fristen)
+        assert b"UID:MABISKOV5202401\r\nCATEGORIES:5WT,MABIS,KOV\r\n" in content
+        assert b"UID:KOV10202401\r\nCATEGORIES:10WT,KOV\r\n" in content
+        assert content == generator.create_ical("mail@test.de", list(fristen)).to_ical()
+
+    def test_generate_and_export_combined_calendar(self, tmp_path: Path) -> None:
+        my_file = tmp_path / "combined.ics"
+        generator = FristenkalenderGenerator()
+        generator.generate_and_export_combined_calendar(my_file, "mail@test.de", 2025, list(FristenType))
+        content = my_file.read_bytes()
+        assert content.count(b"BEGIN:VEVENT") == len(generator.generate_all_fristen(2025))
+        uids = re.findall(rb"^UID:(.*)\r$", content, flags=re.MULTILINE)
+        assert len(uids) == content.count(b"BEGIN:VEVENT")
+        assert len(uids) == len(set(uids))
+        assert b"UID:MABISKOV20202501\r\n" in content
+
+    @pytest.mark.parametrize("fristen_type", [None, FristenType.KOV])
+    def test_generate_frist_for_fristenmonat(self, fristen_type: FristenType | None) -> None:
+        generator = FristenkalenderGenerator()
+        if fristen_type is None:
+            expected: list[FristWithAttributes] = generator.generate_all_fristen(2025)
+        else:
+            expected = list(generator.generate_fristen_for_type(2025, fristen_type))
+        actual = [
+            frist
+            for label in generator.get_labels(fristen_type)
+            for fristenmonat in generator.get_fristenmonate(2025, label)
+            if (frist := generator.generate_frist_for_fristenmonat(2025, fristenmonat, label, fristen_type)) is not None
+        ]
+        assert sorted(actual, key=get_frist_sort_key) == sorted(expected, key=get_frist_sort_key)
+
+    def test_get_fristenmonate_depending_on(self) -> None:
+        generator = FristenkalenderGenerator()
+        assert generator.get_fristenmonate_depending_on(date(2025, 1, 6), "LWT") == {(2025, 1)}
+        assert generator.get_fristenmonate_depending_on(date(2025, 1, 6), "42WT") == {(2024, 11), (2024, 12), (2025, 1)}
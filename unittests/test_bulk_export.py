@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType
+from fristenkalender_generator.bulk_export import ExportJob, ExportJobResult, export_calendars
+
+
+def _create_generator() -> FristenkalenderGenerator:
+    # a fixed clock, such that the DTSTAMPs (and UIDs) of different exports are equal
+    return FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, tzinfo=timezone.utc))
+
+
+class TestBulkExport:
+    @pytest.mark.parametrize("executor_type", ["thread", "process"])
+    def test_export_calendars(self, tmp_path: Path, executor_type: Literal["thread", "process"]) -> None:
+        jobs = [
+            ExportJob(tmp_path / f"{attendee}_{year}_{fristen_type}.ics", f"{attendee}@test.de", year, fristen_type)
+            for attendee in ["alice", "bob"]
+            for year in [2024, 2025]
+            for fristen_type in [None, FristenType.GPKE]
+        ]
+        progress: list[tuple[int, int]] = []
+
+        def progress_callback(_: ExportJobResult, number_of_finished_jobs: int, number_of_jobs: int) -> None:
+            progress.append((number_of_finished_jobs, number_of_jobs))
+
+        generator = _create_generator()
+        results = export_calendars(
+            jobs, generator, executor_type=executor_type, max_workers=2, progress_callback=progress_callback
+        )
+
+        assert [result.job for result in results] == jobs
+        assert all(result.succeeded for result in results)
+        assert progress == [(i, len(jobs)) for i in range(1, len(jobs) + 1)]
+        for job in jobs:
+            expected_path = tmp_path / "expected.ics"
+            if job.fristen_type is None:
+                generator.generate_and_export_whole_calendar(expected_path, job.attendee, job.year)
+            else:
+                generator.generate_and_export_fristen_for_type(expected_path, job.attendee, job.year, job.fristen_type)
+            assert job.file_path.read_bytes() == expected_path.read_bytes()
+
+    def test_failing_jobs_are_reported(self, tmp_path: Path) -> None:
+        jobs = [
+            ExportJob(tmp_path / "does_not_exist" / "2024.ics", "mail@test.de", 2024),
+            ExportJob(tmp_path / "2024.ics", "mail@test.de", 2024),
+        ]
+        results = export_calendars(jobs)
+
+        assert not results[0].succeeded
+        assert isinstance(results[0].error, FileNotFoundError)
+        assert results[1].succeeded
+        assert (tmp_path / "2024.ics").is_file()
+
+    @pytest.mark.parametrize("executor_type", ["thread", "process"])
+    def test_export_no_calendars(self, executor_type: Literal["thread", "process"]) -> None:
+        assert export_calendars([], executor_type=executor_type) == []
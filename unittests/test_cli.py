@@ -0,0 +1,114 @@
+import json
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType, cli
+from fristenkalender_generator.cli import ManifestJob, main, read_manifest, run_jobs
+from fristenkalender_generator.utils import convert_fristen_list_to_calendar_like_dictionary
+
+
+def _fixed_clock() -> datetime:
+    # such that the DTSTAMPs (and UIDs) of different exports are equal
+    return datetime(2025, 1, 8, tzinfo=timezone.utc)
+
+
+class TestCli:
+    def test_json_manifest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cli, "FristenkalenderGenerator", partial(FristenkalenderGenerator, clock=_fixed_clock))
+        manifest = [
+            {"year": 2024, "attendee": "mail@test.de", "output": str(tmp_path / "2024.ics")},
+            {"year": 2024, "fristen_type": "KOV", "format": "json", "output": str(tmp_path / "2024_kov.json")},
+            {"year": 2025, "format": "csv", "output": str(tmp_path / "2025.csv")},
+        ]
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        assert main([str(manifest_path)]) == 0
+
+        generator = FristenkalenderGenerator(clock=_fixed_clock)
+        generator.generate_and_export_whole_calendar(tmp_path / "expected.ics", "mail@test.de", 2024)
+        assert (tmp_path / "2024.ics").read_bytes() == (tmp_path / "expected.ics").read_bytes()
+        expected_json = convert_fristen_list_to_calendar_like_dictionary(
+            list(generator.generate_fristen_for_type(2024, FristenType.KOV))
+        )
+        assert json.loads((tmp_path / "2024_kov.json").read_text(encoding="utf-8")) == expected_json
+        csv_lines = (tmp_path / "2025.csv").read_text(encoding="utf-8").splitlines()
+        assert csv_lines[0] == "wochentag,datum,fristen,feiertags_name"
+        assert "Mi,2024-12-25,,Erster Weihnachtstag" in csv_lines
+
+    def test_csv_manifest_to_stdout(self, tmp_path: Path, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        manifest_path = tmp_path / "manifest.csv"
+        manifest_path.write_text("year,fristen_type,format,attendee\n2024,GELI,ics,a@test.de\n2024,,ics,b@test.de\n")
+
+        assert main([str(manifest_path)]) == 0
+
+        output = capsysbinary.readouterr().out
+        assert output.count(b"BEGIN:VCALENDAR") == 2
+        assert output.index(b"ATTENDEE:a@test.de") < output.index(b"ATTENDEE:b@test.de")
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            pytest.param('[{"format": "json"}]', id="missing year"),
+            pytest.param('[{"year": 2024}]', id="missing attendee"),
+            pytest.param('[{"year": 2024, "format": "pdf"}]', id="unknown format"),
+            pytest.param('[{"year": 2024, "format": "json", "fristen_type": "FOO"}]', id="unknown type"),
+            pytest.param('{"year": 2024}', id="no list"),
+        ],
+    )
+    def test_invalid_manifest(self, manifest: str) -> None:
+        with pytest.raises(ValueError):
+            read_manifest(manifest, "json")
+
+    def test_read_manifest(self) -> None:
+        assert read_manifest('[{"year": 2024, "format": "csv", "output": "out.csv"}]', "json") == [
+            ManifestJob(year=2024, output_format="csv", output="out.csv")
+        ]
+
+    def test_failing_jobs_are_reported(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        missing_directory = tmp_path / "missing"
+        manifest = [
+            {"year": 2024, "attendee": "mail@test.de", "output": str(missing_directory / "2024.ics")},
+            {"year": 2024, "attendee": "mail@test.de", "output": str(tmp_path / "2024.ics")},
+            {"year": 2024, "format": "csv", "output": str(missing_directory / "2024.csv")},
+            {"year": 2024, "format": "json", "output": str(tmp_path / "2024.json")},
+        ]
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        assert main([str(manifest_path)]) == 1
+
+        assert (tmp_path / "2024.ics").exists()
+        assert (tmp_path / "2024.json").exists()
+        errors = capsys.readouterr().err.splitlines()
+        assert len(errors) == 2
+        assert errors[0].startswith("job 1 (") and "2024.ics" in errors[0]
+        assert errors[1].startswith("job 3 (") and "2024.csv" in errors[1]
+
+    def test_run_jobs_results(self, tmp_path: Path) -> None:
+        jobs = [
+            ManifestJob(year=2024, output_format="json"),
+            ManifestJob(year=2024, attendee="mail@test.de", output=str(tmp_path / "2024.ics")),
+        ]
+        results = run_jobs(jobs)
+        assert [result.job for result in results] == jobs
+        assert all(result.succeeded for result in results)
+        assert results[0].output is not None and results[1].output is None
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            pytest.param(["--max-workers", "0", "manifest.json"], id="no workers"),
+            pytest.param(["--max-workers", "-1", "manifest.json"], id="negative workers"),
+            pytest.param(["does_not_exist.json"], id="missing manifest"),
+        ],
+    )
+    def test_invalid_arguments(self, argv: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "manifest.json").write_text("[]", encoding="utf-8")
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv)
+        assert exit_info.value.code == 2
@@ -0,0 +1,126 @@
+import sys
+from array import array
+from datetime import date
+
+import pytest
+
+from fristenkalender_generator import (
+    CompactFrist,
+    FristenColumns,
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+from fristenkalender_generator.compact_fristen import FRISTEN_TYPES, LABELS, NO_REF_MONTH
+
+
+class TestCompactFristen:
+    def test_compact_frist_round_trip(self) -> None:
+        fristen = FristenkalenderGenerator().generate_all_fristen(2024)
+        assert [CompactFrist.from_frist(frist).to_frist() for frist in fristen] == fristen
+
+    @pytest.mark.parametrize("fristen_type", list(FristenType))
+    def test_compact_frist_with_type_round_trip(self, fristen_type: FristenType) -> None:
+        fristen = FristenkalenderGenerator().generate_fristen_for_type(2024, fristen_type)
+        assert [CompactFrist.from_frist(frist).to_frist() for frist in fristen] == fristen
+
+    def test_compact_frist_has_no_dict(self) -> None:
+        compact_frist = CompactFrist(date(2023, 1, 2), "42WT", 10)
+        assert not hasattr(compact_frist, "__dict__")
+        assert compact_frist.description == "BK-Abrechnung (BIKO ⟶ BKV)"
+        with pytest.raises(AttributeError):
+            compact_frist.label = "5WT"  # type:ignore[misc]
+
+    def test_fristen_columns_round_trip(self) -> None:
+        generator = FristenkalenderGenerator()
+        fristen: list[FristWithAttributes | FristWithAttributesAndType] = []
+        fristen += generator.generate_all_fristen(2025)
+        fristen += generator.generate_fristen_for_type(2025, FristenType.KOV)
+        columns = FristenColumns.from_fristen(fristen)
+        assert len(columns) == len(fristen)
+        assert columns.to_fristen() == fristen
+        assert columns[3] == CompactFrist.from_frist(fristen[3])
+        assert list(columns[2:5]) == [CompactFrist.from_frist(frist) for frist in fristen[2:5]]
+
+    def test_fristen_columns_are_smaller(self) -> None:
+        fristen = FristenkalenderGenerator().generate_all_fristen(2025)
+        columns = FristenColumns.from_fristen(fristen)
+        columns_size = sum(
+            sys.getsizeof(column)
+            for column in (columns.ordinals, columns.label_codes, columns.ref_months, columns.fristen_type_codes)
+        )
+        assert columns_size < sum(sys.getsizeof(frist) + sys.getsizeof(frist.__dict__) for frist in fristen)
+
+    def test_fristen_columns_with_different_lengths(self) -> None:
+        columns = FristenColumns.from_fristen(FristenkalenderGenerator().generate_all_fristen(2025))
+        with pytest.raises(ValueError):
+            FristenColumns(columns.ordinals, columns.label_codes[1:], columns.ref_months, columns.fristen_type_codes)
+
+    def test_fristen_columns_with_wrong_typecode(self) -> None:
+        columns = FristenColumns.from_fristen(FristenkalenderGenerator().generate_all_fristen(2025))
+        with pytest.raises(ValueError):
+            FristenColumns(
+                array("q", columns.ordinals), columns.label_codes, columns.ref_months, columns.fristen_type_codes
+            )
+
+    def test_combined_fristen_are_rejected(self) -> None:
+        frist = FristenkalenderGenerator().generate_combined_fristen_for_types(
+            2024, [FristenType.MABIS, FristenType.KOV]
+        )[0]
+        with pytest.raises(TypeError):
+            CompactFrist.from_frist(frist)
+        with pytest.raises(TypeError):
+            FristenColumns.from_fristen([frist])
+
+    def test_fristen_columns_to_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        generator = FristenkalenderGenerator()
+        fristen: list[FristWithAttributes | FristWithAttributesAndType] = []
+        fristen += generator.generate_all_fristen(2025)
+        fristen += generator.generate_fristen_for_type(2025, FristenType.GPKE)
+        actual = FristenColumns.from_fristen(fristen).to_numpy()
+
+        assert actual["date"].dtype == np.dtype("datetime64[D]")
+        assert [d.item() for d in actual["date"]] == [frist.date for frist in fristen]
+        assert [LABELS[code] for code in actual["label"]] == [frist.label for frist in fristen]
+        assert actual["ref_not_in_the_same_month"].tolist() == [frist.ref_not_in_the_same_month for frist in fristen]
+        assert [None if code == -1 else FRISTEN_TYPES[code] for code in actual["fristen_type"]] == [
+            getattr(frist, "fristen_type", None) for frist in fristen
+        ]
+
+    def test_fristen_columns_to_arrow(self) -> None:
+        pytest.importorskip("pyarrow")
+        generator = FristenkalenderGenerator()
+        fristen: list[FristWithAttributes | FristWithAttributesAndType] = []
+        fristen += generator.generate_all_fristen(2025)
+        fristen += generator.generate_fristen_for_type(2025, FristenType.MABIS)
+        actual = FristenColumns.from_fristen(fristen).to_arrow()
+
+        assert actual.to_pylist() == [
+            {
+                "date": frist.date,
+                "label": frist.label,
+                "ref_not_in_the_same_month": frist.ref_not_in_the_same_month,
+                "fristen_type": frist.fristen_type.value if isinstance(frist, FristWithAttributesAndType) else None,
+            }
+            for frist in fristen
+        ]
+
+    def test_fristen_columns_to_arrow_uses_the_column_buffers(self) -> None:
+        pytest.importorskip("pyarrow")
+        columns = FristenColumns.from_fristen(
+            FristenkalenderGenerator().generate_fristen_for_type(2025, FristenType.KOV)
+        )
+        actual = columns.to_arrow()
+
+        assert actual["label"].chunk(0).indices.buffers()[1].address == columns.label_codes.buffer_info()[0]
+        ref_months = actual["ref_not_in_the_same_month"].chunk(0)
+        assert ref_months.buffers()[1].address == columns.ref_months.buffer_info()[0]
+        assert ref_months.null_count == list(columns.ref_months).count(NO_REF_MONTH)
+        fristen_types = actual["fristen_type"].chunk(0).indices
+        assert fristen_types.buffers()[1].address == columns.fristen_type_codes.buffer_info()[0]
+
+    def test_empty_fristen_columns_to_arrow(self) -> None:
+        pytest.importorskip("pyarrow")
+        assert FristenColumns().to_arrow().num_rows == 0
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+
+from fristenkalender_generator import FristenDateIndex, FristenkalenderGenerator, FristenOfDate, FristenType
+
+
+@pytest.fixture(scope="module")
+def date_index() -> FristenDateIndex:
+    return FristenDateIndex(2023, 2026)
+
+
+class TestFristenDateIndex:
+    def test_index_contains_all_fristen(self, date_index: FristenDateIndex) -> None:
+        for year in range(2023, 2027):
+            fristen = [
+                frist for frist in FristenkalenderGenerator().generate_all_fristen(year) if frist.date.year == year
+            ]
+            for frist in fristen:
+                assert frist.date in date_index
+                assert frist.label in date_index.get_labels(frist.date)
+            assert sum(
+                len(fristen_of_date.labels)
+                for fristen_of_date in date_index.between(date(year, 1, 1), date(year, 12, 31))
+            ) == len(fristen)
+
+    def test_get(self, date_index: FristenDateIndex) -> None:
+        # the 5WT of May 2024 and the 26WT of April 2024 are on the 8th of May
+        assert date_index.get(date(2024, 5, 8)) == FristenOfDate(
+            date=date(2024, 5, 8), labels=("5WT", "26WT"), fristen_types=(FristenType.MABIS, FristenType.KOV)
+        )
+        assert date_index.get(date(2024, 5, 8).toordinal()) == date_index.get(date(2024, 5, 8))
+        assert date_index.get(date(2024, 5, 4)) is None  # saturday
+        assert date(2024, 5, 4) not in date_index
+
+    def test_between(self, date_index: FristenDateIndex) -> None:
+        actual = list(date_index.between(date(2024, 5, 1), date(2024, 5, 31)))
+        assert [fristen_of_date.date for fristen_of_date in actual] == sorted(
+            {frist.date for frist in FristenkalenderGenerator().fristen_between(date(2024, 5, 1), date(2024, 5, 31))}
+        )
+
+    def test_slice(self, date_index: FristenDateIndex) -> None:
+        assert list(date_index[date(2024, 5, 1) : date(2024, 5, 31)]) == list(
+            date_index.between(date(2024, 5, 1), date(2024, 5, 31))
+        )
+        assert list(date_index[: date(2023, 1, 31)]) == list(date_index.between(date(2023, 1, 1), date(2023, 1, 31)))
+        assert list(date_index[date(2026, 12, 1) :]) == list(date_index.between(date(2026, 12, 1), date(2026, 12, 31)))
+        with pytest.raises(ValueError):
+            date_index[date(2024, 5, 1) : date(2024, 5, 31) : 2]
+
+    @pytest.mark.parametrize("day", [pytest.param(date(2022, 12, 31)), pytest.param(date(2027, 1, 1))])
+    def test_out_of_range(self, date_index: FristenDateIndex, day: date) -> None:
+        with pytest.raises(ValueError):
+            date_index.get(day)
+        with pytest.raises(ValueError):
+            date_index.get_labels(day)
+        assert day not in date_index
+        assert day.toordinal() not in date_index
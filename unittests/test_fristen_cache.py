@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType
+from fristenkalender_generator.fristen_cache import FristenCache
+
+
+class TestFristenCache:
+    def test_load_without_stored_fristen(self, tmp_path: Path) -> None:
+        assert FristenCache(tmp_path).load(2024, None) is None
+
+    @pytest.mark.parametrize("fristen_type", [None, *FristenType])
+    def test_store_and_load(self, tmp_path: Path, fristen_type: FristenType | None) -> None:
+        generator = FristenkalenderGenerator()
+        if fristen_type is None:
+            fristen = generator.generate_all_fristen(2025)
+        else:
+            fristen = generator.generate_fristen_for_type(2025, fristen_type)  # type:ignore[assignment]
+        cache = FristenCache(tmp_path)
+        cache.store(2025, fristen_type, fristen)
+        assert cache.load(2025, fristen_type) == fristen
+        assert cache.load(2024, fristen_type) is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        cache = FristenCache(tmp_path)
+        cache.store(2025, None, FristenkalenderGenerator().generate_all_fristen(2025))
+        (path,) = cache.cache_dir.glob("*.bin")
+        path.write_bytes(path.read_bytes()[:-1])
+        assert cache.load(2025, None) is None
+
+    def test_generator_uses_cache(self, tmp_path: Path) -> None:
+        expected_fristen = FristenkalenderGenerator().generate_all_fristen(2024)
+        expected_fristen_for_type = FristenkalenderGenerator().generate_fristen_for_type(2024, FristenType.KOV)
+
+        generator = FristenkalenderGenerator(cache=FristenCache(tmp_path))
+        assert generator.generate_all_fristen(2024) == expected_fristen
+        assert generator.generate_fristen_for_type(2024, FristenType.KOV) == expected_fristen_for_type
+        assert len(list(FristenCache(tmp_path).cache_dir.glob("*.bin"))) == 2
+
+        warm_generator = FristenkalenderGenerator(cache=FristenCache(tmp_path))
+        assert warm_generator.generate_all_fristen(2024) == expected_fristen
+        assert warm_generator.generate_fristen_for_type(2024, FristenType.KOV) == expected_fristen_for_type
+        assert warm_generator._working_day_index is None  # nothing has been computed
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from bdew_datetimes import create_bdew_calendar
+from holidays import HolidayBase
+
+from fristenkalender_generator import FristenkalenderGenerator
+from fristenkalender_generator.holiday_provider import HolidayProvider
+
+
+class _CountingCalendarFactory:
+    def __init__(self, additional_holidays: dict[date, str] | None = None) -> None:
+        self.number_of_calls = 0
+        self.additional_holidays = additional_holidays or {}
+
+    def __call__(self) -> HolidayBase:
+        self.number_of_calls += 1
+        calendar = create_bdew_calendar()
+        for holiday_date, holiday_name in self.additional_holidays.items():
+            calendar[holiday_date] = holiday_name
+        return calendar
+
+
+class TestHolidayProvider:
+    def test_get_holidays(self) -> None:
+        holidays = HolidayProvider().get_holidays(2023, 2024)
+        assert holidays[date(2023, 12, 24)] == "Heiligabend"
+        assert holidays[date(2024, 1, 1)] == "Neujahr"
+        assert all(2023 <= holiday_date.year <= 2024 for holiday_date in holidays)
+        assert list(holidays) == sorted(holidays)
+
+    def test_get_holiday_names(self) -> None:
+        actual = HolidayProvider().get_holiday_names(date(2023, 12, 24), date(2024, 1, 1))
+        assert actual == {
+            date(2023, 12, 24): "Heiligabend",
+            date(2023, 12, 25): "Erster Weihnachtstag",
+            date(2023, 12, 26): "Zweiter Weihnachtstag",
+            date(2023, 12, 31): "Silvester",
+            date(2024, 1, 1): "Neujahr",
+        }
+
+    def test_calendar_is_created_once(self) -> None:
+        calendar_factory = _CountingCalendarFactory()
+        holiday_provider = HolidayProvider(calendar_factory)
+        holiday_provider.get_holidays(2020, 2025)
+        holiday_provider.get_holidays(2023, 2024)
+        assert holiday_provider.is_holiday(date(2025, 6, 6))
+        assert not holiday_provider.is_holiday(date(2025, 6, 5))
+        assert calendar_factory.number_of_calls == 1
+
+    def test_invalidate(self) -> None:
+        calendar_factory = _CountingCalendarFactory()
+        holiday_provider = HolidayProvider(calendar_factory)
+        holiday_provider.get_holidays(2024, 2024)
+        generation = holiday_provider.generation
+        holiday_provider.invalidate()
+        holiday_provider.get_holidays(2024, 2024)
+        assert holiday_provider.generation == generation + 1
+        assert calendar_factory.number_of_calls == 2
+
+    def test_concurrent_access(self) -> None:
+        holiday_provider = HolidayProvider()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda year: holiday_provider.get_holidays(2000, year), [2030] * 16))
+        assert all(result == results[0] for result in results)
+
+    def test_generator_uses_holiday_provider(self) -> None:
+        calendar_factory = _CountingCalendarFactory()
+        holiday_provider = HolidayProvider(calendar_factory)
+        generator = FristenkalenderGenerator(holiday_provider)
+        fristen_before = generator.generate_all_fristen_for_given_wt(2023, 5, "5WT")
+        assert date(2023, 9, 7) in [frist.date for frist in fristen_before]
+
+        calendar_factory.additional_holidays = {date(2023, 9, 4): "Testfeiertag"}
+        holiday_provider.invalidate()
+        fristen_after = generator.generate_all_fristen_for_given_wt(2023, 5, "5WT")
+        assert date(2023, 9, 8) in [frist.date for frist in fristen_after]
+
+    def test_holidays_are_loaded_lazily(self) -> None:
+        calendar_factory = _CountingCalendarFactory()
+        provider = HolidayProvider(calendar_factory)
+        FristenkalenderGenerator(holiday_provider=provider)
+        assert calendar_factory.number_of_calls == 0
+        provider.is_holiday(date(2024, 12, 25))
+        assert calendar_factory.number_of_calls == 1
+
+    def test_import_does_not_load_holidays(self) -> None:
+        # in a new interpreter, because the tests of this process have loaded the holidays already
+        code = (
+            "import sys\n"
+            "from fristenkalender_generator import FristenkalenderGenerator\n"
+            "FristenkalenderGenerator()\n"
+            "print('holidays' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
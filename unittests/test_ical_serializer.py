@@ -0,0 +1,95 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from icalendar import Event
+
+from fristenkalender_generator import (
+    FristenkalenderGenerator,
+    FristenType,
+    FristWithAttributes,
+    FristWithAttributesAndType,
+)
+from fristenkalender_generator.bdew_calendar_generator import _group_fristen_into_series
+from fristenkalender_generator.ical_serializer import serialize_vevent
+
+
+def _create_icalendar_event(
+    summary: str, description: str, dtstart: date, dtstamp: datetime, uid: str, categories: str
+) -> Event:
+    event = Event()
+    event.add("summary", summary)
+    event.add("description", description)
+    event.add("dtstart", dtstart)
+    event.add("transp", "TRANSPARENT")
+    event.add("dtstamp", dtstamp)
+    event.add("uid", uid)
+    event.add("categories", categories)
+    return event
+
+
+class TestIcalSerializer:
+    @pytest.mark.parametrize(
+        "summary, description",
+        [
+            pytest.param("42WT (⭐10)", "short", id="short"),
+            pytest.param("5WT", "a;b,c\\d\ne\r\nf", id="escaping"),
+            pytest.param("5WT", "ä" * 200, id="multi byte characters are not split"),
+            pytest.param("5WT", "x" * 73 + ",y", id="escape sequence at fold boundary"),
+            pytest.param("5WT", "⟶" * 37 + "\n" * 20, id="mixed"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "dtstamp",
+        [
+            pytest.param(datetime(2025, 1, 8, 15, 25, 57, tzinfo=timezone.utc), id="utc"),
+            pytest.param(datetime(2025, 1, 8, 15, 25, 57), id="naive"),
+        ],
+    )
+    def test_serialize_vevent_is_equal_to_icalendar(self, summary: str, description: str, dtstamp: datetime) -> None:
+        expected = _create_icalendar_event(summary, description, date(2024, 1, 2), dtstamp, "uid,1", "5WT").to_ical()
+        actual = serialize_vevent(summary, description, date(2024, 1, 2), dtstamp, "uid,1", "5WT")
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "fristen_type", [pytest.param(None, id="all fristen")] + [pytest.param(t, id=t.value) for t in FristenType]
+    )
+    def test_serialize_ical_event_is_equal_to_create_ical_event(self, fristen_type: FristenType | None) -> None:
+        generator = FristenkalenderGenerator()
+        if fristen_type is None:
+            fristen = generator.generate_all_fristen(2025)
+        else:
+            fristen = generator.generate_fristen_for_type(2025, fristen_type)  # type:ignore[assignment]
+        for frist in fristen:
+            event = generator.create_ical_event(frist)
+            expected = event.to_ical()
+            assert event.DTSTAMP is not None
+            actual = serialize_vevent(
+                summary=str(event["SUMMARY"]),
+                description=str(event["DESCRIPTION"]),
+                dtstart=frist.date,
+                dtstamp=event.DTSTAMP,
+                uid=str(event["UID"]),
+                categories=frist.label,
+            )
+            assert actual == expected
+
+    def test_non_utc_dtstamp_is_rejected(self) -> None:
+        dtstamp = datetime.fromisoformat("2025-01-08T15:25:57+01:00")
+        with pytest.raises(ValueError):
+            serialize_vevent("5WT", "foo", date(2024, 1, 2), dtstamp, "uid", "5WT")
+
+    @pytest.mark.parametrize(
+        "fristen_type", [pytest.param(None, id="all fristen")] + [pytest.param(t, id=t.value) for t in FristenType]
+    )
+    def test_serialize_ical_series_event_is_equal_to_create_ical_series_event(
+        self, fristen_type: FristenType | None
+    ) -> None:
+        generator = FristenkalenderGenerator(clock=lambda: datetime(2025, 1, 8, 15, 25, 57, tzinfo=timezone.utc))
+        fristen: list[FristWithAttributes | FristWithAttributesAndType] = []
+        for year in range(2024, 2027):
+            if fristen_type is None:
+                fristen += generator.generate_all_fristen(year)
+            else:
+                fristen += generator.generate_fristen_for_type(year, fristen_type)
+        for series in _group_fristen_into_series(fristen):
+            assert generator.serialize_ical_series_event(series) == generator.create_ical_series_event(series).to_ical()
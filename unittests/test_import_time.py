@@ -0,0 +1,33 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_MICROSECONDS = 250_000
+"""
+a generous upper bound for the cumulative import time of the package (measured with -X importtime)
+"""
+
+_CUMULATIVE_IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| fristenkalender_generator$", re.MULTILINE)
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+class TestImportTime:
+    @pytest.mark.parametrize("module_name", ["icalendar", "bdew_datetimes", "holidays", "importlib.metadata"])
+    def test_heavy_dependencies_are_imported_lazily(self, module_name: str) -> None:
+        result = _run_python(f"import sys, fristenkalender_generator; print({module_name!r} in sys.modules)")
+        assert result.stdout.strip() == "False"
+
+    def test_import_time_is_within_budget(self) -> None:
+        # best of several runs, so that a single slow run (e.g. a cold file system cache) doesn't fail the test
+        import_times = []
+        for _ in range(5):
+            result = _run_python("import fristenkalender_generator", "-X", "importtime")
+            match = _CUMULATIVE_IMPORT_TIME.search(result.stderr)
+            assert match is not None
+            import_times.append(int(match.group(1)))
+        assert min(import_times) < IMPORT_TIME_BUDGET_MICROSECONDS
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+from bdew_datetimes import create_bdew_calendar
+from holidays import HolidayBase
+
+from fristenkalender_generator import FristenkalenderGenerator, FristenType, FristWithAttributes
+from fristenkalender_generator.bdew_calendar_generator import get_frist_key
+from fristenkalender_generator.holiday_provider import HolidayProvider
+from fristenkalender_generator.incremental import diff_fristen, regenerate_fristen
+
+
+def _create_calendar_with_test_holiday() -> HolidayBase:
+    calendar = create_bdew_calendar()
+    calendar[date(2023, 9, 4)] = "Testfeiertag"
+    return calendar
+
+
+class TestIncremental:
+    def test_get_frist_key(self) -> None:
+        # the 42WT of November 2023 is in January 2024
+        fristen = FristenkalenderGenerator().generate_all_fristen_for_given_wt(2024, 42, "42WT")
+        frist = next(frist for frist in fristen if frist.date.month == 1)
+        assert frist.ref_not_in_the_same_month == 10
+        key = get_frist_key(frist)
+        assert (key.year, key.month, key.label, key.fristen_type) == (2023, 11, "42WT", None)
+        assert key.to_ical_uid() == "ALL42202311"
+
+    def test_get_frist_key_of_combined_frist(self) -> None:
+        generator = FristenkalenderGenerator()
+        frist = generator.generate_combined_fristen_for_types(2024, [FristenType.MABIS, FristenType.KOV])[0]
+        with pytest.raises(TypeError):
+            get_frist_key(frist)
+
+    def test_regenerate_without_changes(self) -> None:
+        previous_fristen = FristenkalenderGenerator().generate_all_fristen(2023)
+        assert not regenerate_fristen(previous_fristen, 2023)
+
+    @pytest.mark.parametrize("fristen_type", [pytest.param(None), pytest.param(FristenType.KOV)])
+    def test_regenerate_after_new_holiday(self, fristen_type: FristenType | None) -> None:
+        generator = FristenkalenderGenerator(HolidayProvider(_create_calendar_with_test_holiday))
+        previous_fristen: list[FristWithAttributes]
+        if fristen_type is None:
+            previous_fristen = FristenkalenderGenerator().generate_all_fristen(2023)
+            expected = generator.generate_all_fristen(2023)
+        else:
+            previous_fristen = list(FristenkalenderGenerator().generate_fristen_for_type(2023, fristen_type))
+            expected = sorted(generator.generate_fristen_for_type(2023, fristen_type), key=lambda frist: frist.date)
+
+        changeset = regenerate_fristen(
+            previous_fristen, 2023, [date(2023, 9, 4)], fristen_type=fristen_type, generator=generator
+        )
+
+        assert not changeset.added and not changeset.removed
+        assert all(moved_frist.previous.date < moved_frist.current.date for moved_frist in changeset.moved)
+        assert {moved_frist.current.date for moved_frist in changeset.moved if moved_frist.current.label == "5WT"} == {
+            date(2023, 9, 8)
+        }
+        full_diff = diff_fristen(previous_fristen, expected)
+        assert {moved_frist.key: moved_frist.current for moved_frist in changeset.moved} == {
+            moved_frist.key: moved_frist.current for moved_frist in full_diff.moved
+        }
+        assert [frist.date for frist in changeset.apply_to(previous_fristen)] == [frist.date for frist in expected]
+        assert sorted(changeset.apply_to(previous_fristen), key=str) == sorted(expected, key=str)
+
+    def test_regenerate_with_new_and_changed_labels(self) -> None:
+        generator = FristenkalenderGenerator()
+        expected = generator.generate_all_fristen(2025)
+        previous_fristen = [frist for frist in expected if frist.label != "42WT"]
+        previous_fristen += generator.generate_specific_fristen(2025, [(2, "3LWT")])  # wrong rule for 3LWT
+
+        changeset = regenerate_fristen(previous_fristen, 2025, changed_labels=["3LWT"], generator=generator)
+
+        assert {frist.label for frist in changeset.added} == {"42WT"}
+        assert changeset.moved and all(moved_frist.current.label == "3LWT" for moved_frist in changeset.moved)
+        assert changeset.apply_to(previous_fristen) == expected
+
+    def test_diff_fristen(self) -> None:
+        previous_fristen = FristenkalenderGenerator().generate_all_fristen(2024)
+        current_fristen = previous_fristen[1:]
+        changeset = diff_fristen(previous_fristen, current_fristen)
+        assert changeset.removed == [previous_fristen[0]]
+        assert not changeset.added and not changeset.moved
+        assert changeset.apply_to(previous_fristen) == current_fristen
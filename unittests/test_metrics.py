@@ -0,0 +1,40 @@
+import io
+from pathlib import Path
+
+from fristenkalender_generator import FristenCache, FristenkalenderGenerator
+from fristenkalender_generator.metrics import InMemoryMetricsSink
+
+
+class TestMetrics:
+    def test_generation_and_export_metrics(self, tmp_path: Path) -> None:
+        metrics = InMemoryMetricsSink()
+        generator = FristenkalenderGenerator(metrics=metrics)
+        fristen = generator.generate_all_fristen(2024)
+        generator.generate_and_export_whole_calendar(tmp_path / "2024.ics", "mail@test.de", 2024)
+
+        assert metrics.counters["fristen_generated"] == 2 * len(fristen)
+        assert metrics.counters["events_built"] == len(fristen)
+        assert metrics.counters["bytes_written"] == (tmp_path / "2024.ics").stat().st_size
+        assert metrics.counters["working_day_index_years"] > 0
+        assert "cache_hits" not in metrics.counters
+        for name in ["build_working_day_index", "generate_fristen", "build_ical", "serialize_ical", "write_ical"]:
+            assert metrics.get_total_duration(name) > 0
+
+    def test_export_ical_stream_metrics(self) -> None:
+        metrics = InMemoryMetricsSink()
+        generator = FristenkalenderGenerator(metrics=metrics)
+        fristen = generator.generate_all_fristen(2025)
+        stream = io.BytesIO()
+        generator.export_ical_stream(stream, "mail@test.de", fristen, use_fast_serializer=True)
+
+        assert metrics.counters["events_built"] == len(fristen)
+        assert metrics.counters["bytes_written"] == len(stream.getvalue())
+        assert len(metrics.durations["export_ical_stream"]) == 1
+
+    def test_cache_metrics(self, tmp_path: Path) -> None:
+        metrics = InMemoryMetricsSink()
+        generator = FristenkalenderGenerator(cache=FristenCache(tmp_path), metrics=metrics)
+        generator.generate_all_fristen(2024)
+        generator.generate_all_fristen(2024)
+        assert metrics.counters["cache_misses"] == 1
+        assert metrics.counters["cache_hits"] == 1
@@ -1,7 +1,13 @@
+from datetime import date, timedelta
+
 import pytest
 
 from fristenkalender_generator import FristenkalenderGenerator
-from fristenkalender_generator.utils import _CalendarEntry, convert_fristen_list_to_calendar_like_dictionary
+from fristenkalender_generator.utils import (
+    _CalendarEntry,
+    convert_fristen_list_to_calendar_like_dictionary,
+    iterate_calendar_entries,
+)
 
 
 class TestUtils:
@@ -44,3 +50,17 @@ class TestUtils:
         # I json.dumped the actual dict and sent it to Annika M. for the PDF calendar
         for key, value in expected_entries.items():
             assert actual[key] == value
+
+    def test_iterate_calendar_entries(self) -> None:
+        fristen = FristenkalenderGenerator().generate_all_fristen(2024)[::-1]  # the order doesn't matter
+        actual = list(iterate_calendar_entries(fristen))
+        assert actual[0]["datum"] == "2023-12-01"
+        assert actual[-1]["datum"] == max(frist.date for frist in fristen).isoformat()
+        for entry, expected_date in zip(
+            actual, (date(2023, 12, 1) + timedelta(days=i) for i in range(len(actual))), strict=True
+        ):
+            assert entry["datum"] == expected_date.isoformat()
+        assert actual == list(convert_fristen_list_to_calendar_like_dictionary(fristen).values())
+
+    def test_iterate_calendar_entries_without_fristen(self) -> None:
+        assert not any(iterate_calendar_entries([]))
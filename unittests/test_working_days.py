@@ -0,0 +1,145 @@
+from calendar import monthrange
+from datetime import date, timedelta
+
+import pytest
+from bdew_datetimes.periods import get_next_working_day, get_nth_working_day_of_month, get_previous_working_day
+
+from fristenkalender_generator import FristenkalenderGenerator
+from fristenkalender_generator.working_days import WorkingDayIndex
+
+
+def _add_working_days_with_bdew_datetimes(day: date, offset: int) -> date:
+    result = day
+    for _ in range(abs(offset)):
+        result = get_next_working_day(result) if offset > 0 else get_previous_working_day(result)
+    return result
+
+
+class TestWorkingDayIndex:
+    @pytest.mark.parametrize("year", [2022, 2023, 2024, 2025, 2026])
+    @pytest.mark.parametrize("nth_day", [1, 5, 12, 21, 42])
+    def test_nth_working_day_of_month_matches_bdew_datetimes(self, year: int, nth_day: int) -> None:
+        index = WorkingDayIndex(year, year + 1)
+        for month in range(1, 13):
+            expected = get_nth_working_day_of_month(nth_day, start=date(year, month, 1))
+            assert index.get_nth_working_day_of_month(nth_day, year, month) == expected
+
+    @pytest.mark.parametrize("year", [2022, 2023, 2024, 2025, 2026])
+    @pytest.mark.parametrize("nth_day", [0, 1, 3])
+    def test_nth_last_working_day_of_month_matches_bdew_datetimes(self, year: int, nth_day: int) -> None:
+        index = WorkingDayIndex(year, year)
+        for month in range(1, 13):
+            last_date_of_month = date(year, month, monthrange(year, month)[1])
+            if nth_day == 0:
+                expected = get_previous_working_day(last_date_of_month + timedelta(days=1))
+            else:
+                expected = last_date_of_month
+                for _ in range(nth_day):
+                    expected = get_previous_working_day(expected)
+            assert index.get_nth_last_working_day_of_month(nth_day, year, month) == expected
+
+    @pytest.mark.parametrize(
+        "year, month, nth_day, expected",
+        [
+            pytest.param(2022, 5, 3, date(2022, 5, 25), id="Himmelfahrt is skipped"),
+            pytest.param(2024, 12, 3, date(2024, 12, 23), id="Heiligabend and Silvester are skipped"),
+            pytest.param(2023, 4, 0, date(2023, 4, 28)),
+        ],
+    )
+    def test_nth_last_working_day_of_month(self, year: int, month: int, nth_day: int, expected: date) -> None:
+        assert WorkingDayIndex(year, year).get_nth_last_working_day_of_month(nth_day, year, month) == expected
+
+    def test_month_outside_of_index_raises(self) -> None:
+        index = WorkingDayIndex(2023, 2023)
+        with pytest.raises(ValueError):
+            index.get_nth_working_day_of_month(5, 2024, 1)
+        with pytest.raises(ValueError):
+            index.get_nth_working_day_of_month(42, 2023, 12)  # would be in February 2024
+
+    def test_covers(self) -> None:
+        index = WorkingDayIndex(2022, 2024)
+        assert index.covers(2023, 2024)
+        assert not index.covers(2021, 2023)
+
+    @pytest.mark.parametrize("offset", [-25, -10, -1, 0, 1, 3, 25])
+    def test_add_working_days_matches_bdew_datetimes(self, offset: int) -> None:
+        index = WorkingDayIndex(2023, 2025)
+        for day_of_year in range(0, 365, 7):
+            day = date(2024, 1, 1) + timedelta(days=day_of_year)
+            assert index.add_working_days(day, offset) == _add_working_days_with_bdew_datetimes(day, offset)
+
+    @pytest.mark.parametrize(
+        "day, offset, expected",
+        [
+            pytest.param(date(2024, 12, 23), 1, date(2024, 12, 27), id="Heiligabend and Weihnachten are skipped"),
+            pytest.param(date(2024, 12, 27), -1, date(2024, 12, 23)),
+            pytest.param(date(2024, 12, 25), -1, date(2024, 12, 23), id="from a holiday backwards"),
+            pytest.param(date(2024, 12, 25), 1, date(2024, 12, 27), id="from a holiday forwards"),
+            pytest.param(date(2024, 12, 25), 0, date(2024, 12, 25), id="offset 0 keeps the date"),
+        ],
+    )
+    def test_add_working_days(self, day: date, offset: int, expected: date) -> None:
+        assert WorkingDayIndex(2024, 2025).add_working_days(day, offset) == expected
+
+    def test_add_working_days_outside_of_index_raises(self) -> None:
+        index = WorkingDayIndex(2024, 2024)
+        with pytest.raises(ValueError):
+            index.add_working_days(date(2025, 1, 2), 1)
+        with pytest.raises(ValueError):
+            index.add_working_days(date(2024, 1, 2), -5)  # would be in December 2023
+
+    def test_add_working_days_to_dates_matches_scalar(self) -> None:
+        np = pytest.importorskip("numpy")
+        index = WorkingDayIndex(2023, 2025)
+        days = [date(2024, 1, 1) + timedelta(days=day_of_year) for day_of_year in range(366)]
+        offsets = [(day_of_year % 41) - 20 for day_of_year in range(366)]
+        actual = index.add_working_days_to_dates(np.array(days, dtype="datetime64[D]"), np.array(offsets))
+        assert actual.dtype == np.dtype("datetime64[D]")
+        assert actual.tolist() == [
+            index.add_working_days(day, offset) for day, offset in zip(days, offsets, strict=True)
+        ]
+
+    def test_add_working_days_to_dates_broadcasts(self) -> None:
+        np = pytest.importorskip("numpy")
+        index = WorkingDayIndex(2024, 2025)
+        actual = index.add_working_days_to_dates(np.array(["2024-12-23", "2024-12-27"], dtype="datetime64[D]"), 1)
+        assert actual.tolist() == [date(2024, 12, 27), date(2024, 12, 30)]
+
+    def test_add_working_days_to_dates_outside_of_index_raises(self) -> None:
+        np = pytest.importorskip("numpy")
+        index = WorkingDayIndex(2024, 2024)
+        with pytest.raises(ValueError):
+            index.add_working_days_to_dates(np.array(["2024-06-03", "2025-01-02"], dtype="datetime64[D]"), [0, 0])
+        with pytest.raises(ValueError):
+            index.add_working_days_to_dates(np.array(["2024-12-30"], dtype="datetime64[D]"), [10])
+
+
+class TestFristenkalenderGeneratorAddWorkingDays:
+    def test_add_working_days(self) -> None:
+        np = pytest.importorskip("numpy")
+        days = np.array(["2024-05-02", "2024-12-23", "1999-01-04", "2100-06-15"], dtype="datetime64[D]")
+        offsets = np.array([-10, 3, 500, -1])
+        actual = FristenkalenderGenerator().add_working_days(days, offsets)
+        expected = [
+            _add_working_days_with_bdew_datetimes(day, int(offset))
+            for day, offset in zip(days.tolist(), offsets, strict=True)
+        ]
+        assert actual.tolist() == expected
+
+    def test_add_working_days_without_dates(self) -> None:
+        np = pytest.importorskip("numpy")
+        actual = FristenkalenderGenerator().add_working_days(np.array([], dtype="datetime64[D]"), [])
+        assert actual.shape == (0,)
+
+    def test_add_working_days_propagates_nat(self) -> None:
+        np = pytest.importorskip("numpy")
+        days = np.array(["2024-12-23", "NaT", "2024-12-27"], dtype="datetime64[D]")
+        actual = FristenkalenderGenerator().add_working_days(days, [1, 5, -1])
+        assert np.isnat(actual[1])
+        assert actual[[0, 2]].tolist() == [date(2024, 12, 27), date(2024, 12, 23)]
+
+    def test_add_working_days_only_nat(self) -> None:
+        np = pytest.importorskip("numpy")
+        actual = FristenkalenderGenerator().add_working_days(np.array(["NaT", "NaT"], dtype="datetime64[D]"), -3)
+        assert actual.shape == (2,)
+        assert np.isnat(actual).all()